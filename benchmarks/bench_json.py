@@ -0,0 +1,51 @@
+"""Compares the JSON integration with the naive ``default=`` / ``object_hook`` approach."""
+import io
+import json
+import timeit
+from enum import Enum
+
+from extendableenum import auto_null_member, EnumJSONEncoder, EnumDecoder, iter_encode, enum_object_hook
+
+
+@auto_null_member
+class Colour(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+MEMBERS = [Colour.RED, Colour.GREEN, Colour.NULL, Colour.BLUE] * 25000
+RECORDS = json.dumps([{'colour': member.value} for member in MEMBERS])
+VALUES = json.dumps([member.value for member in MEMBERS])
+
+
+def naive_default(o):
+    if isinstance(o, Enum):
+        return None if o is Colour.NULL else o.value
+    raise TypeError(o)
+
+
+def naive_hook(obj):
+    if 'colour' in obj:
+        try:
+            obj['colour'] = Colour(obj['colour'])
+        except ValueError:
+            pass
+    return obj
+
+
+def bench(name, func, number=5):
+    print(f'{name:<40} {min(timeit.repeat(func, number=number, repeat=3)) / number * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    decoder = EnumDecoder(Colour)
+    hook = enum_object_hook({'colour': Colour})
+    bench('encode: naive default=', lambda: json.dumps(MEMBERS, default=naive_default))
+    bench('encode: EnumJSONEncoder', lambda: json.dumps(MEMBERS, cls=EnumJSONEncoder))
+    bench('encode: iter_encode', lambda: ''.join(iter_encode(MEMBERS)))
+    bench('decode objects: naive object_hook', lambda: json.loads(RECORDS, object_hook=naive_hook))
+    bench('decode objects: enum_object_hook', lambda: json.loads(RECORDS, object_hook=hook))
+    bench('decode array: naive Colour(v)', lambda: [Colour(value) for value in json.loads(VALUES)])
+    bench('decode array: decode_many', lambda: decoder.decode_many(json.loads(VALUES)))
+    bench('decode array: iter_decode', lambda: list(decoder.iter_decode(io.StringIO(VALUES))))
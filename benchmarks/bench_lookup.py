@@ -0,0 +1,59 @@
+"""Compares ``get``/``get_by_name`` with try/except lookups on miss-heavy workloads."""
+import timeit
+from enum import Enum
+
+from extendableenum import inheritable_enum, auto_null_member
+
+
+@auto_null_member
+class Status(Enum):
+    ACTIVE = 1
+    INACTIVE = 2
+
+
+@inheritable_enum
+class Base(Enum):
+    A = 1
+    B = 2
+
+
+class Derived(Base):
+    C = 3
+
+
+# 90% misses
+VALUES = [1, 5, 6, 7, 8, 9, 10, 11, 12, 13] * 10000
+NAMES = ['ACTIVE', 'X', 'Y', 'Z', 'W', 'V', 'U', 'T', 'S', 'R'] * 10000
+
+
+def naive_value(the_enum, default):
+    def lookup(value):
+        try:
+            return the_enum(value)
+        except ValueError:
+            return default
+    return lookup
+
+
+def naive_name(the_enum, default):
+    def lookup(name):
+        try:
+            return the_enum[name]
+        except KeyError:
+            return default
+    return lookup
+
+
+def bench(name, func, number=5):
+    print(f'{name:<40} {min(timeit.repeat(func, number=number, repeat=3)) / number * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    for the_enum, default in ((Status, Status.NULL), (Derived, None)):
+        value_lookup = naive_value(the_enum, default)
+        name_lookup = naive_name(the_enum, default)
+        get, get_by_name = the_enum.get, the_enum.get_by_name
+        bench(f'{the_enum.__name__} value: try/except', lambda: [value_lookup(value) for value in VALUES])
+        bench(f'{the_enum.__name__} value: get', lambda: [get(value) for value in VALUES])
+        bench(f'{the_enum.__name__} name: try/except', lambda: [name_lookup(name) for name in NAMES])
+        bench(f'{the_enum.__name__} name: get_by_name', lambda: [get_by_name(name) for name in NAMES])
@@ -1,9 +1,44 @@
-from .extendableenum import inheritable_enum, \
-    set_auto_null, auto_null_member, AutoNullEnum, \
+from .extendableenum import enum_version, invalidate_enum, enum_cache, enum_code, \
+    inheritable_enum, all_members, \
+    set_auto_null, auto_null_member, filter_valid, null_mask, \
     post_mixin_enum, \
     copy_enum_members
 
-__all__ = ['inheritable_enum',
-           'set_auto_null', 'auto_null_member', 'AutoNullEnum',
+__all__ = ['enum_version', 'invalidate_enum', 'enum_cache', 'enum_code', 'EnumCounter',
+           'inheritable_enum', 'all_members',
+           'set_auto_null', 'auto_null_member', 'AutoNullEnum', 'filter_valid', 'null_mask',
            'post_mixin_enum',
-           'copy_enum_members']
\ No newline at end of file
+           'copy_enum_members',
+           'EnumFactory',
+           'load_schema', 'build_enums',
+           'EnumJSONEncoder', 'EnumDecoder', 'iter_encode', 'enum_object_hook',
+           'DecorationTracer', 'trace_decorations',
+           'UnionDecoder', 'UnionMatch',
+           'save_code_table', 'open_code_table', 'CodeTable']
+
+# Attributes imported from their module on first access, to keep the import of the package cheap.
+_lazy_attributes = {'AutoNullEnum': '.extendableenum',
+                    'EnumFactory': '.factory',
+                    'load_schema': '.schema', 'build_enums': '.schema',
+                    'EnumJSONEncoder': '.jsonenum', 'EnumDecoder': '.jsonenum',
+                    'iter_encode': '.jsonenum', 'enum_object_hook': '.jsonenum',
+                    'DecorationTracer': '.profile', 'trace_decorations': '.profile',
+                    'UnionDecoder': '.union', 'UnionMatch': '.union',
+                    'save_code_table': '.codetable', 'open_code_table': '.codetable', 'CodeTable': '.codetable',
+                    'EnumCounter': '.counter'}
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
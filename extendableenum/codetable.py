@@ -0,0 +1,298 @@
+import enum
+import json
+import mmap
+import os
+import struct
+from enum import Enum, EnumMeta, Flag, IntEnum, IntFlag
+from threading import Lock
+
+from . import extendableenum as _ext
+
+_MAGIC = b'XENUMCT2'
+# magic, header length
+_PREAMBLE = struct.Struct('<8sI')
+# offset and length of the name, of the encoded value and of the lookup key of a member, relative to the data
+# section.
+_RECORD = struct.Struct('<IIIIII')
+_INDEX = struct.Struct('<I')
+
+# the classes the saved enums are recreated from, most specific first.
+_BASES = [base for base in (IntFlag, IntEnum, getattr(enum, 'StrEnum', None), Flag, Enum) if base is not None]
+_MEMBER_TYPES = {member_type.__name__: member_type for member_type in (int, str, float, bytes)}
+
+
+def _encode_value(value) -> bytes:
+    """Encodes a value as a type tag followed by its payload. Only equal values of the same type are equal."""
+    if value is None:
+        return b'N'
+    if isinstance(value, bool):
+        return b'T' if value else b'F'
+    if isinstance(value, int):
+        return b'i' + str(value).encode('ascii')
+    if isinstance(value, float):
+        return b'f' + repr(value).encode('ascii')
+    if isinstance(value, str):
+        return b's' + value.encode('utf-8')
+    if isinstance(value, bytes):
+        return b'b' + value
+    raise TypeError(f'Cannot store value {value!r} in a code table, only None, bool, int, float, str '
+                    f'and bytes values are supported!')
+
+
+def _lookup_key(value) -> bytes:
+    """Encodes a value so that values which are equal (eg: ``1``, ``1.0`` and ``True``) have the same key."""
+    if isinstance(value, (bool, int)) or isinstance(value, float) and value.is_integer():
+        return b'i' + str(int(value)).encode('ascii')
+    return _encode_value(value)
+
+
+def _decode_value(data: bytes):
+    tag, payload = data[:1], data[1:]
+    if tag == b'N':
+        return None
+    if tag in (b'T', b'F'):
+        return tag == b'T'
+    if tag == b'i':
+        return int(payload)
+    if tag == b'f':
+        return float(payload)
+    if tag == b's':
+        return payload.decode('utf-8')
+    return bytes(payload)
+
+
+def save_code_table(the_enum, path):
+    """
+    Writes the names and values of the members of an enum to a code table file.
+
+    The file can be opened with :func:`open_code_table`. All members are stored, including the members hidden by
+    :func:`~extendableenum.inheritable_enum` (see :func:`~extendableenum.all_members`), along with the auto null
+    configuration of the class, its base class (eg: ``IntEnum`` or :class:`~extendableenum.AutoNullEnum`) and the
+    mixed-in type of its members.
+
+    Args:
+        the_enum: the ``Enum`` class.
+        path: the file to write.
+
+    Raises:
+        TypeError: if the class is not an ``Enum``, a value is not None, bool, int, float, str or bytes, or the
+            members are of a mixed-in type other than int, str, float or bytes.
+    """
+    if not isinstance(the_enum, EnumMeta):
+        raise TypeError(f'Cannot save non enum class {the_enum}')
+    # AutoNullEnum is only created on first use: if it does not exist yet, no class can be derived from it.
+    auto_null_enum = vars(_ext).get('AutoNullEnum')
+    if auto_null_enum is not None and issubclass(the_enum, auto_null_enum) and the_enum is not auto_null_enum:
+        base = auto_null_enum
+    else:
+        base = next(base for base in _BASES if issubclass(the_enum, base))
+    # noinspection PyProtectedMember
+    member_type = the_enum._member_type_
+    # noinspection PyProtectedMember
+    if member_type is base._member_type_:
+        member_type = None
+    elif _MEMBER_TYPES.get(member_type.__name__) is not member_type:
+        raise TypeError(f'Cannot save enum {the_enum.__qualname__} with members of type {member_type.__name__} in '
+                        f'a code table, only int, str, float and bytes mixed-in types are supported!')
+    members = _ext.all_members(the_enum)
+    names = [member.name.encode('utf-8') for member in members]
+    values = [_encode_value(member.value) for member in members]
+    keys = [_lookup_key(member.value) for member in members]
+    null_name = getattr(the_enum, 'auto_null_name', None)
+    header = json.dumps({'name': the_enum.__name__,
+                         'qualname': the_enum.__qualname__,
+                         'module': the_enum.__module__,
+                         'base': base.__name__,
+                         'type': None if member_type is None else member_type.__name__,
+                         'count': len(members),
+                         'auto_null': None if null_name is None else [null_name, the_enum.auto_null_value]}
+                        ).encode('utf-8')
+
+    records = []
+    offset = 0
+    for name, value, key in zip(names, values, keys):
+        records.append(_RECORD.pack(offset, len(name), offset + len(name), len(value),
+                                    offset + len(name) + len(value), len(key)))
+        offset += len(name) + len(value) + len(key)
+    # the indexes list the record numbers, sorted by name and by lookup key, for binary searches.
+    name_index = sorted(range(len(members)), key=names.__getitem__)
+    # stable sort, so the first of several members with equal values is found first.
+    value_index = sorted(range(len(members)), key=keys.__getitem__)
+
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as table_file:
+        table_file.write(_PREAMBLE.pack(_MAGIC, len(header)))
+        table_file.write(header)
+        table_file.write(b''.join(records))
+        table_file.write(b''.join(_INDEX.pack(i) for i in name_index))
+        table_file.write(b''.join(_INDEX.pack(i) for i in value_index))
+        for name, value, key in zip(names, values, keys):
+            table_file.write(name)
+            table_file.write(value)
+            table_file.write(key)
+    os.replace(temp_path, path)
+
+
+class CodeTable:
+    """
+    A code table opened with :func:`open_code_table`.
+
+    Names and values are looked up directly in the memory mapped file with binary searches, without creating
+    any enum members. The ``Enum`` class itself, with all its members, is only created on first access to
+    :attr:`enum` or to a member (eg: ``table['NAME']`` or :meth:`member`).
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as table_file:
+            self._map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_length = _PREAMBLE.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            self._map.close()
+            raise ValueError(f'{path} is not a code table!')
+        position = _PREAMBLE.size
+        self._header = json.loads(self._map[position:position + header_length].decode('utf-8'))
+        self._count = self._header['count']
+        self._records = position + header_length
+        self._name_index = self._records + self._count * _RECORD.size
+        self._value_index = self._name_index + self._count * _INDEX.size
+        self._data = self._value_index + self._count * _INDEX.size
+        self._enum = None
+        self._lock = Lock()
+
+    def close(self):
+        """Closes the mapped file. Members created before remain valid."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def name(self) -> str:
+        """The name of the enum class."""
+        return self._header['name']
+
+    def _field_bytes(self, i, field):
+        """Returns the name (0), encoded value (1) or lookup key (2) of a record."""
+        offset, length = _RECORD.unpack_from(self._map, self._records + i * _RECORD.size)[2 * field:2 * field + 2]
+        offset += self._data
+        return self._map[offset:offset + length]
+
+    def _name_bytes(self, i):
+        return self._field_bytes(i, 0)
+
+    def _value_bytes(self, i):
+        return self._field_bytes(i, 1)
+
+    def _key_bytes(self, i):
+        return self._field_bytes(i, 2)
+
+    def _search(self, index, key, get_bytes) -> int:
+        """Returns the record number with the key, or -1. ``index`` is the offset of the sorted index."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if get_bytes(_INDEX.unpack_from(self._map, index + middle * _INDEX.size)[0]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            i = _INDEX.unpack_from(self._map, index + low * _INDEX.size)[0]
+            if get_bytes(i) == key:
+                return i
+        return -1
+
+    def _find_name(self, name) -> int:
+        return self._search(self._name_index, name.encode('utf-8'), self._name_bytes)
+
+    def _find_value(self, value) -> int:
+        try:
+            key = _lookup_key(value)
+        except TypeError:
+            return -1
+        return self._search(self._value_index, key, self._key_bytes)
+
+    def __contains__(self, name):
+        return self._find_name(name) >= 0
+
+    def names(self):
+        """Returns a generator of the member names, in definition order."""
+        for i in range(self._count):
+            yield self._name_bytes(i).decode('utf-8')
+
+    def value_of(self, name, default=None):
+        """Returns the value of the member with the name, or ``default``. Does not create the enum."""
+        i = self._find_name(name)
+        return _decode_value(self._value_bytes(i)) if i >= 0 else default
+
+    def name_of(self, value, default=None):
+        """
+        Returns the name of the member with the value, or ``default``. Does not create the enum.
+
+        As for ``Enum`` lookups, equal values match (eg: ``1.0`` matches the member with the value ``1``).
+        """
+        i = self._find_value(value)
+        return self._name_bytes(i).decode('utf-8') if i >= 0 else default
+
+    @property
+    def enum(self) -> EnumMeta:
+        """The ``Enum`` class, created with all its members on first access."""
+        if self._enum is None:
+            with self._lock:
+                if self._enum is None:
+                    members = [(self._name_bytes(i).decode('utf-8'), _decode_value(self._value_bytes(i)))
+                               for i in range(self._count)]
+                    if self._header['base'] == 'AutoNullEnum':
+                        base = _ext.AutoNullEnum
+                        # the null member is inherited from AutoNullEnum.
+                        inherited = {member.name for member in _ext.all_members(base)}
+                        members = [(name, value) for name, value in members if name not in inherited]
+                    else:
+                        base = next(base for base in _BASES if base.__name__ == self._header['base'])
+                    options = {'module': self._header['module'], 'qualname': self._header['qualname']}
+                    if self._header['type'] is not None:
+                        options['type'] = _MEMBER_TYPES[self._header['type']]
+                    new_enum = base(self._header['name'], members, **options)
+                    if self._header['auto_null'] is not None and base is not _ext.AutoNullEnum:
+                        # noinspection PyProtectedMember
+                        new_enum = _ext._add_auto_null_member(new_enum, *self._header['auto_null'])
+                    else:
+                        # noinspection PyProtectedMember
+                        _ext._add_lookup_methods(new_enum)
+                        # noinspection PyProtectedMember
+                        _ext._assign_codes(new_enum)
+                    # noinspection PyProtectedMember
+                    _ext._add_code_hash(new_enum)
+                    self._enum = new_enum
+        return self._enum
+
+    def __getitem__(self, name):
+        """Returns the member with the name. Creates the enum on first use."""
+        if self._find_name(name) < 0:
+            raise KeyError(name)
+        return getattr(self.enum, name)
+
+    def member(self, value, default=None):
+        """Returns the member with the value, or ``default``. Creates the enum on first use."""
+        name = self.name_of(value)
+        return getattr(self.enum, name) if name is not None else default
+
+
+def open_code_table(path) -> CodeTable:
+    """
+    Opens a code table written by :func:`save_code_table`.
+
+    The file is memory mapped, so opening a table is fast regardless of its size.
+
+    Args:
+        path: the code table file.
+
+    Raises:
+        ValueError: if the file is not a code table.
+    """
+    return CodeTable(path)
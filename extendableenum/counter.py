@@ -0,0 +1,112 @@
+from collections import Counter
+from enum import EnumMeta
+
+from .extendableenum import enum_cache, all_members, enum_code
+
+
+@enum_cache
+def _code_table(the_enum):
+    """Maps the ids of the members of the class to their code, and lists the members by code."""
+    codes = {id(member): enum_code(member) for member in all_members(the_enum)}
+    members = [None] * (max(codes.values(), default=-1) + 1)
+    for member in all_members(the_enum):
+        members[codes[id(member)]] = member
+    return codes, members
+
+
+class EnumCounter:
+    """
+    Counts the members of an enum class.
+
+    A ``Counter`` for enum members, backed by a list of counts indexed by the code of the members (see
+    :func:`~extendableenum.enum_code`), which includes the members hidden by
+    :func:`~extendableenum.inheritable_enum`. Members are never hashed, their ids are counted in bulk.
+
+    Args:
+        the_enum: the ``Enum`` class.
+        members: an optional iterable of members to count.
+
+    Raises:
+        TypeError: if the class is not an ``Enum``.
+    """
+
+    def __init__(self, the_enum, members=()):
+        if not isinstance(the_enum, EnumMeta):
+            raise TypeError(f'Cannot count the members of non enum class {the_enum}')
+        self.enum = the_enum
+        self._codes, self._members = _code_table(the_enum)
+        self._counts = [0] * len(self._members)
+        self.update(members)
+
+    def _code(self, member) -> int:
+        try:
+            return self._codes[id(member)]
+        except KeyError:
+            raise ValueError(f'{member!r} is not a member of {self.enum.__qualname__}') from None
+
+    def update(self, members):
+        """
+        Counts the members of an iterable.
+
+        Raises:
+            ValueError: if an object is not a member of the class. No members are counted in this case.
+        """
+        # counting ids avoids hashing the members and runs at C speed.
+        counted = Counter(map(id, members))
+        codes = self._codes
+        if not codes.keys() >= counted.keys():
+            invalid = next(key for key in counted if key not in codes)
+            raise ValueError(f'Object with id {invalid} is not a member of {self.enum.__qualname__}')
+        counts = self._counts
+        for key, count in counted.items():
+            counts[codes[key]] += count
+
+    def add(self, member, count=1):
+        """Counts a member ``count`` times."""
+        self._counts[self._code(member)] += count
+
+    def __getitem__(self, member) -> int:
+        return self._counts[self._code(member)]
+
+    def __setitem__(self, member, count):
+        self._counts[self._code(member)] = count
+
+    def __contains__(self, member):
+        return id(member) in self._codes and self[member] != 0
+
+    def __iter__(self):
+        """Iterates over the counted members, in code order."""
+        return (member for member, count in zip(self._members, self._counts) if count)
+
+    def __len__(self):
+        return sum(1 for count in self._counts if count)
+
+    def __eq__(self, other):
+        if isinstance(other, EnumCounter):
+            return self.enum is other.enum and self._counts == other._counts
+        return NotImplemented
+
+    def __repr__(self):
+        counts = ', '.join(f'{member!r}: {count}' for member, count in self.most_common())
+        return f'{type(self).__name__}({self.enum.__qualname__}, {{{counts}}})'
+
+    def items(self):
+        """Returns the (member, count) pairs of the counted members, in code order."""
+        return [(member, count) for member, count in zip(self._members, self._counts) if count]
+
+    def most_common(self, n=None):
+        """Returns the ``n`` most common (member, count) pairs, or all of them, most common first."""
+        items = sorted(self.items(), key=lambda item: item[1], reverse=True)
+        return items if n is None else items[:n]
+
+    def total(self) -> int:
+        """Returns the sum of the counts."""
+        return sum(self._counts)
+
+    def clear(self):
+        """Resets all counts to 0."""
+        self._counts = [0] * len(self._members)
+
+    def to_counter(self) -> Counter:
+        """Returns the counts as a ``collections.Counter``."""
+        return Counter(dict(self.items()))
@@ -1,9 +1,22 @@
+import sys
+# the _thread lock is the one threading provides, without the cost of importing threading with the package.
+from _thread import RLock
 from enum import Enum, EnumMeta
+from functools import wraps
 from types import MethodType
 
 _auto_null_member_name = 'NULL'
 _auto_null_member_value = None
 
+# Modification counters (see enum_version) are keyed by the id of the class, which is cheaper to look up
+# than a weak reference. The entries are removed when the class is collected, before its id can be reused.
+_enum_versions = {}
+_enum_refs = {}
+
+# Serializes the modification of classes. Readers never take the lock: modifications are published by
+# replacing attributes with fully built values rather than mutating them in place.
+_mutation_lock = RLock()
+
 
 def set_auto_null(name: str, value):
     """
@@ -31,6 +44,85 @@ def set_auto_null(name: str, value):
     _auto_null_member_value = value
 
 
+def enum_version(the_enum) -> int:
+    """
+    Returns the modification counter of an enum class.
+
+    The counter starts at 0 and is incremented every time the class, or any of its bases, is modified
+    after creation by one of the decorators of this package or by :func:`restore`. Values derived from
+    an enum class can be stored along with the counter and recomputed when it changes. See
+    :func:`enum_cache`.
+
+    Args:
+        the_enum: the ``Enum`` class.
+    """
+    return _enum_versions.get(id(the_enum), 0)
+
+
+def _forget_enum(key):
+    """Removes the counter of a collected class."""
+    _enum_refs.pop(key, None)
+    _enum_versions.pop(key, None)
+
+
+def _track_enum(the_enum):
+    """Makes sure the counter of the class is removed when it is collected."""
+    # imported on first use, to keep the import of the package cheap.
+    from weakref import ref
+
+    key = id(the_enum)
+    if key not in _enum_refs:
+        _enum_refs[key] = ref(the_enum, lambda _, key=key: _forget_enum(key))
+
+
+def invalidate_enum(the_enum):
+    """
+    Marks an enum class and all of its subclasses as modified.
+
+    This is called automatically by the decorators of this package. It only needs to be called when an
+    enum class is modified by other means (eg: reassigning ``__bases__`` directly).
+
+    Args:
+        the_enum: the modified ``Enum`` class.
+    """
+    with _mutation_lock:
+        pending = [the_enum]
+        while pending:
+            cls = pending.pop()
+            _track_enum(cls)
+            _enum_versions[id(cls)] = _enum_versions.get(id(cls), 0) + 1
+            pending.extend(cls.__subclasses__())
+
+
+def enum_cache(builder):
+    """
+    Caches a value derived from an enum class until the class is modified.
+
+    Function decorator for functions taking an enum class as their only argument. The result is cached
+    per class along with the :func:`enum_version` of the class, and the function is only called again
+    once the class has been modified.
+
+    Args:
+        builder: the function computing the derived value.
+    """
+    @wraps(builder)
+    def cached(the_enum):
+        version = _enum_versions.get(id(the_enum), 0)
+        # The values are stored in the class itself, as they usually reference its members: storing
+        # them anywhere else would keep the class alive.
+        caches = vars(the_enum).get('__enum_caches__')
+        entry = caches.get(cached) if caches is not None else None
+        if entry is None or entry[0] != version:
+            entry = (version, builder(the_enum))
+            if caches is None:
+                caches = {}
+                setattr(the_enum, '__enum_caches__', caches)
+            caches[cached] = entry
+        return entry[1]
+
+    return cached
+
+
 def _restore(the_enum):
     """
     Restores the original state of an inheritable enum.
@@ -41,11 +133,17 @@ def _restore(the_enum):
         This method is automatically added as a bound class method to any class decorated by
         :func:`inheritable_enum`.
     """
-    for inh_member in the_enum.__inheritable_members__:
+    with _mutation_lock:
+        if '__inheritable_members__' not in vars(the_enum):
+            raise AttributeError(f'{the_enum} has already been restored!')
+        inheritable_members = vars(the_enum)['__inheritable_members__']
+        # the member names are swapped in as a new list, so that readers never see a partial list.
         # noinspection PyProtectedMember
-        the_enum._member_names_.append(inh_member)
-    delattr(the_enum, '__inheritable_members__')
-    delattr(the_enum, 'restore')
+        the_enum._member_names_ = the_enum._member_names_ + list(inheritable_members)
+        delattr(the_enum, '__inheritable_members__')
+        delattr(the_enum, 'restore')
+        # the counter is only incremented once the changes are visible, see enum_cache.
+        invalidate_enum(the_enum)
 
 
 def inheritable_enum(the_enum):
@@ -74,19 +172,189 @@ def inheritable_enum(the_enum):
     """
     if type(the_enum) is not EnumMeta:
         raise TypeError(f'Cannot add inheritable enum members to a non-enum object!')
-    setattr(the_enum, '__inheritable_members__', [])
-    # noinspection PyProtectedMember
-    for member in the_enum._member_names_:
-        the_enum.__inheritable_members__.append(member)
-    the_enum._member_names_ = []
+    with _mutation_lock:
+        # noinspection PyProtectedMember
+        setattr(the_enum, '__inheritable_members__', list(the_enum._member_names_))
 
-    # Adds the restore method to the class. This method is bound to the decorated class as a classmethod.
-    bound_restore = MethodType(_restore, the_enum)
-    setattr(the_enum, 'restore', bound_restore)
+        # Adds the restore method to the class. This method is bound to the decorated class as a classmethod.
+        bound_restore = MethodType(_restore, the_enum)
+        setattr(the_enum, 'restore', bound_restore)
+        _add_lookup_methods(the_enum)
 
+        # the members are only hidden once the class is fully decorated, in a single assignment.
+        the_enum._member_names_ = []
+        invalidate_enum(the_enum)
+        _assign_codes(the_enum)
     return the_enum
 
 
+@enum_cache
+def all_members(the_enum):
+    """
+    Returns every member of an enum class, including inheritable and inherited members.
+
+    Enums decorated with :func:`inheritable_enum` (and their subclasses) hide some of their members from
+    ``__iter__`` and ``__len__``. This function returns a tuple of all members available on the class, with
+    inherited members first, in definition order. Aliases are not included.
+
+    The tuple is computed once per class and cached, so repeated calls are cheap. The cache is refreshed
+    when the class or any of its bases is modified (see :func:`enum_cache`).
+
+    Args:
+        the_enum: the ``Enum`` class.
+
+    Raises:
+        TypeError: if the argument is not an ``Enum``.
+    """
+    if not isinstance(the_enum, EnumMeta):
+        raise TypeError(f'Cannot get the members of non enum class {the_enum}')
+    names = {}
+    for cls in reversed(the_enum.__mro__):
+        if not isinstance(cls, EnumMeta):
+            continue
+        # inheritable members are only hidden from _member_names_, so both lists are needed.
+        for name in vars(cls).get('_member_names_', ()):
+            names.setdefault(name, None)
+        for name in vars(cls).get('__inheritable_members__', ()):
+            names.setdefault(name, None)
+    return tuple(getattr(the_enum, name) for name in names)
+
+
+_missing = object()
+
+
+@enum_cache
+def _lookup_tables(the_enum):
+    """
+    Maps the values and names (including aliases of the class) to the members, see :func:`all_members`.
+    The default member is looked up here once, since failed class attribute lookups are slow on enums.
+    """
+    values = {}
+    unhashable = []
+    for member in all_members(the_enum):
+        try:
+            values.setdefault(member._value_, member)
+        except TypeError:
+            unhashable.append(member)
+    names = {member._name_: member for member in all_members(the_enum)}
+    names.update(the_enum.__members__)
+    return values, unhashable, names, getattr(the_enum, '__null_member__', None)
+
+
+def _get(cls, value, default=_missing):
+    """
+    Returns the member with the value, or ``default`` if there is none.
+
+    Unlike ``MyEnum(value)``, no exception is raised for missing values, and the members hidden by
+    :func:`inheritable_enum` are included. If ``default`` is omitted, the auto null member is returned
+    for classes that have one (see :func:`auto_null_member`), ``None`` otherwise.
+    """
+    values, unhashable, _, null = _lookup_tables(cls)
+    try:
+        member = values.get(value, _missing)
+    except TypeError:
+        member = next((member for member in unhashable if member._value_ == value), _missing)
+    if member is _missing:
+        return null if default is _missing else default
+    return member
+
+
+def _get_by_name(cls, name, default=_missing):
+    """
+    Returns the member with the name, or ``default`` if there is none.
+
+    Unlike ``MyEnum[name]``, no exception is raised for missing names, and the members hidden by
+    :func:`inheritable_enum` are included. If ``default`` is omitted, the auto null member is returned
+    for classes that have one (see :func:`auto_null_member`), ``None`` otherwise.
+    """
+    _, _, names, null = _lookup_tables(cls)
+    member = names.get(name, _missing)
+    if member is _missing:
+        return null if default is _missing else default
+    return member
+
+
+def _assign_codes(the_enum):
+    """Gives the members of the class without a code their position in :func:`all_members` as a code."""
+    for code, member in enumerate(all_members(the_enum)):
+        if '_code_' not in vars(member):
+            member._code_ = code
+
+
+def _code_hash(self):
+    """Returns the hash precomputed from the code of the member, see :func:`_add_code_hash`."""
+    try:
+        return self._hash_
+    except AttributeError:
+        # pseudo-members (eg: combinations of Flag members) and members of undecorated subclasses have no code
+        # hash, they are hashed as by Enum.__hash__.
+        return hash(self._name_)
+
+
+def _add_code_hash(the_enum):
+    """
+    Hashes the members of a class by their code, with the hash computed once.
+
+    This is only used for the classes created by this package (eg: rebuilt by :func:`copy_enum_members`), as the
+    members of an existing class may already be used as dict keys. Only pure ``Enum`` classes using the default
+    hash are changed, as the members of mixed-in types (eg: ``str``) must hash like their values.
+    """
+    # noinspection PyProtectedMember
+    if the_enum._member_type_ is not object or the_enum.__hash__ not in (Enum.__hash__, _code_hash):
+        return
+    for member in all_members(the_enum):
+        # inherited members keep the hash of the class defining them.
+        if type(member) is the_enum and '_hash_' not in vars(member):
+            member._hash_ = hash((the_enum.__qualname__, enum_code(member)))
+    setattr(the_enum, '__hash__', _code_hash)
+
+
+def enum_code(member) -> int:
+    """
+    Returns the code of an enum member.
+
+    Members of classes decorated by this package get a code when they are decorated: their position in
+    :func:`all_members` of the class. Codes are kept by the members, so the members inherited by subclasses of
+    an inheritable enum keep the codes of the base class, and the subclass members are numbered after them.
+    Members of :func:`copy_enum_members` classes are new members, numbered in the order they are copied.
+    Members of other classes get their code on first use.
+
+    The classes created by this package (the classes rebuilt by :func:`auto_null_member` and
+    :func:`copy_enum_members`, and the classes created by :class:`EnumFactory`, :func:`build_enums` and
+    :class:`CodeTable`) hash their members by their code, with the hash computed once. Classes modified in place
+    keep their hash, as their members may already be used as dict keys.
+
+    Args:
+        member: the enum member.
+
+    Raises:
+        ValueError: if the member is a pseudo-member (eg: a combination of ``Flag`` members), which has no code.
+    """
+    try:
+        return member._code_
+    except AttributeError:
+        _assign_codes(type(member))
+    try:
+        return member._code_
+    except AttributeError:
+        raise ValueError(f'{member!r} is not a member of {type(member).__qualname__} and has no code') from None
+
+
+def _caller_module(depth=2):
+    """Returns the name of the module of a calling frame, as the ``Enum`` functional API does, or ``None``."""
+    try:
+        return sys._getframe(depth).f_globals.get('__name__')
+    except (AttributeError, ValueError):
+        return None
+
+
+def _add_lookup_methods(the_enum):
+    """Adds the ``get`` and ``get_by_name`` classmethods, unless the class already has such attributes."""
+    for name, method in (('get', _get), ('get_by_name', _get_by_name)):
+        if not hasattr(the_enum, name):
+            setattr(the_enum, name, classmethod(method))
+
+
 def _rebuild_enum(_cls, new_member_names):
     """Rebuild an enum with new member names. All other values should be preserved."""
     # get the member_type, first_enum and any extra bases/mixins.
@@ -105,30 +373,19 @@ def _rebuild_enum(_cls, new_member_names):
         _new_enum.__bases__ = tuple(extra_bases) + (first_enum,)
     # add back any other items in the __dict__ that may not have been included in the rebuild.
     for key in _cls.__dict__:
+        # the cached null member and values belong to the old class, the null member is looked up again below.
+        if key in ('__null_member__', '__enum_caches__'):
+            continue
         # Enum automatically adds a rather boring doc, so make sure that doesn't stick!
         if key not in _new_enum.__dict__ or key == '__doc__':
             setattr(_new_enum, key, _cls.__dict__[key])
+    if '__null_member__' in _cls.__dict__:
+        setattr(_new_enum, '__null_member__', getattr(_new_enum, _cls.auto_null_name))
     return _new_enum
 
 
-def auto_null_member(the_enum):
-    """
-    Adds the null member to an enum if required.
-
-    Enum class decorator which will add the auto null member to the class if missing. The auto null
-    member will have the name and value as configured at the module level which can be set
-    using :func:`set_auto_null`.
-
-    If the decorated class doesn't define any members, the class is
-    considered a mixin and becomes inheritable (see :func:`inheritable_enum`), otherwise, the null
-    member is prepended to the defined members.
-
-    Args:
-        the_enum: the decorated class.
-
-    Raises:
-        TypeError: if the decorated class is not an ``Enum``.
-    """
+def _add_auto_null_member(the_enum, null_name, null_value):
+    """Adds the null member with the given name and value. See :func:`auto_null_member`."""
 
     if type(the_enum) is not EnumMeta:
         raise TypeError(f'Non-enum classes cannot be decorated with auto_null_member!')
@@ -167,14 +424,14 @@ def auto_null_member(the_enum):
 
         def new_compare_fn(self, other):
             if self.__class__ is other.__class__:
-                if self is self.__class__(_auto_null_member_value):
+                if self is self.__class__(null_value):
                     # self_null_return
                     if func.__name__ in ('__lt__', '__le__'):
                         return True
                     # __gt__ or __ge__, self_null_return
                     else:
                         return False
-                elif other is other.__class__(_auto_null_member_value):
+                elif other is other.__class__(null_value):
                     # null_other_return
                     if func.__name__ in ('__lt__', '__le__'):
                         return False
@@ -187,22 +444,22 @@ def auto_null_member(the_enum):
         return new_compare_fn
 
     # if no members are defined, or the only member defined is the null member (ie a mixin).
-    is_mixin = len(the_enum) == 0 or (len(the_enum) == 1 and _auto_null_member_name in the_enum.__members__)
+    is_mixin = len(the_enum) == 0 or (len(the_enum) == 1 and null_name in the_enum.__members__)
     # if the null member was defined explicitly in the class definition.
-    if len(the_enum) and _auto_null_member_name in the_enum.__members__:
+    if len(the_enum) and null_name in the_enum.__members__:
         # and it is the correct value
-        if the_enum.__members__[_auto_null_member_name].value == _auto_null_member_value:
+        if the_enum.__members__[null_name].value == null_value:
             # no need to rebuild the class, so we can return the original class.
             new_enum = the_enum
         # cls defined a null member with the incorrect value (overwrite attempt). Throw TypeError.
         else:
             raise ValueError(f"{the_enum} decorated with auto_null_member:\n"
-                             f"\tAttempted to redefine '{_auto_null_member_name}' member with incorrect value"
-                             f" {the_enum.__members__[_auto_null_member_name].value}.\n"
-                             f"\t'{_auto_null_member_name}' member must have value {_auto_null_member_value}.")
+                             f"\tAttempted to redefine '{null_name}' member with incorrect value"
+                             f" {the_enum.__members__[null_name].value}.\n"
+                             f"\t'{null_name}' member must have value {null_value}.")
     else:
         # Enum will be rebuilt with the auto-null member inserted as the first element
-        new_member_names = [(_auto_null_member_name, _auto_null_member_value)]
+        new_member_names = [(null_name, null_value)]
         new_member_names += [(name, val.value) for name, val in the_enum.__members__.items()]
         new_enum = _rebuild_enum(the_enum, new_member_names)
 
@@ -214,8 +471,10 @@ def auto_null_member(the_enum):
     # Add the auto_null_member_name and auto_null_member_value as a class attribute.
     # This is to allow modifying the module level name and value while retaining a record of what name/value
     # was used when creating the individual classes.
-    setattr(new_enum, 'auto_null_name', _auto_null_member_name)
-    setattr(new_enum, 'auto_null_value', _auto_null_member_value)
+    setattr(new_enum, 'auto_null_name', null_name)
+    setattr(new_enum, 'auto_null_value', null_value)
+    # The null member itself is cached, so that null checks are a single identity comparison.
+    setattr(new_enum, '__null_member__', getattr(new_enum, null_name))
 
     # If the decorated enum had comparison methods, they need to be redefined to accommodate the null member
     # redefine the comparison functions if they exist in the original class to allow for comparisons between
@@ -226,21 +485,105 @@ def auto_null_member(the_enum):
         if old_function is not None and type(old_function).__name__ != 'wrapper_descriptor':
             setattr(new_enum, compare_function, _compare_function_binder(old_function))
 
+    _add_lookup_methods(new_enum)
+    invalidate_enum(new_enum)
+    _assign_codes(new_enum)
+    if new_enum is not the_enum:
+        _add_code_hash(new_enum)
     return new_enum
 
 
-@auto_null_member
-class AutoNullEnum(Enum):
-    """A Base class for auto null Enums."""
+def auto_null_member(the_enum):
+    """
+    Adds the null member to an enum if required.
+
+    Enum class decorator which will add the auto null member to the class if missing. The auto null
+    member will have the name and value as configured at the module level which can be set
+    using :func:`set_auto_null`.
+
+    If the decorated class doesn't define any members, the class is
+    considered a mixin and becomes inheritable (see :func:`inheritable_enum`), otherwise, the null
+    member is prepended to the defined members.
+
+    Args:
+        the_enum: the decorated class.
+
+    Raises:
+        TypeError: if the decorated class is not an ``Enum``.
+
+    Note:
+        The null member is stored in the ``__null_member__`` class attribute, so checking whether a
+        member is null (eg: ``member is member.__null_member__``) is a single identity comparison. See
+        :func:`filter_valid` and :func:`null_mask` for batches of members.
+    """
+    return _add_auto_null_member(the_enum, _auto_null_member_name, _auto_null_member_value)
+
+
+def filter_valid(members) -> list:
+    """
+    Returns the members which are not a null member.
+
+    Members of classes without the auto null member (see :func:`auto_null_member`) are always valid.
+
+    Args:
+        members: an iterable of enum members.
+    """
+    return [member for member in members if member is not getattr(member, '__null_member__', None)]
+
+
+def null_mask(members) -> list:
+    """
+    Returns a list of bools, ``True`` where the member is a null member.
+
+    Members of classes without the auto null member (see :func:`auto_null_member`) are never null.
+
+    Args:
+        members: an iterable of enum members.
+    """
+    return [member is getattr(member, '__null_member__', None) for member in members]
+
+
+def _create_auto_null_enum():
+    """Creates :class:`AutoNullEnum`, always using the default null member name and value."""
+    class AutoNullEnum(Enum):
+        """A Base class for auto null Enums."""
+
+        @classmethod
+        def auto_null_member(cls):
+            """Returns the null member."""
+            return cls.__null_member__
+
+        @property
+        def is_null(self):
+            """``True`` for the null member, ``False`` for valid members."""
+            return self is self.__null_member__
+
+        def __bool__(self):
+            """Valid members return ``True``, null member returns ``False``."""
+            return self is not self.__null_member__
+
+    AutoNullEnum.__qualname__ = 'AutoNullEnum'
+    return _add_auto_null_member(AutoNullEnum, 'NULL', None)
+
+
+# Module attributes created on first access, to keep the import of the package cheap.
+_lazy_attributes = {'AutoNullEnum': _create_auto_null_enum}
+_lazy_lock = RLock()
+
+
+def __getattr__(name):
+    try:
+        create = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    with _lazy_lock:
+        if name not in globals():
+            globals()[name] = create()
+    return globals()[name]
 
-    @classmethod
-    def auto_null_member(cls):
-        """Returns the null member."""
-        return getattr(cls, cls.auto_null_name)
 
-    def __bool__(self):
-        """Valid members return ``True``, null member returns ``False``."""
-        return self is not self.__class__.auto_null_member()
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
 
 
 def post_mixin_enum(the_enum):
@@ -261,6 +604,10 @@ def post_mixin_enum(the_enum):
             raise TypeError(f'{new_mixin}: cannot extend enumeration {the_enum}')
         # Note that the new mixin cannot be appended to the bases, as this breaks enum functionality.
         the_enum.__bases__ = (new_mixin,) + the_enum.__bases__
+        _add_lookup_methods(the_enum)
+        invalidate_enum(the_enum)
+        # the enum may be defined elsewhere, with members already used as keys, so its hash is kept.
+        _assign_codes(the_enum)
         return new_mixin
 
     return insert_class
@@ -289,7 +636,11 @@ def copy_enum_members(*args):
             new_member_names += [(name, val.value) for name, val in base_enum.__members__.items()]
         new_member_names += [(name, val.value) for name, val in derived_enum.__members__.items()]
         setattr(derived_enum, '__copied_from__', args)
-        return _rebuild_enum(derived_enum, new_member_names)
+        new_enum = _rebuild_enum(derived_enum, new_member_names)
+        _add_lookup_methods(new_enum)
+        _assign_codes(new_enum)
+        _add_code_hash(new_enum)
+        return new_enum
 
     return add_members
 
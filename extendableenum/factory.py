@@ -0,0 +1,105 @@
+from collections import OrderedDict, namedtuple
+from enum import Enum, EnumMeta
+from threading import Lock
+
+from . import extendableenum as _ext
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _typed_key(value):
+    """Returns a memo key for a value, which only equals the keys of equal values of the same types."""
+    if isinstance(value, tuple):
+        return tuple, tuple(_typed_key(item) for item in value)
+    return type(value), value
+
+
+class EnumFactory:
+    """
+    Creates and memoizes enums built with :func:`~extendableenum.copy_enum_members`.
+
+    Calling the factory creates a new enum class copying the members of the source enums, in the same way as
+    decorating an empty class with :func:`~extendableenum.copy_enum_members`. Classes are memoized by name,
+    source classes, additional members and auto null configuration, so identical definitions return the same
+    class. The least recently used classes are discarded once ``maxsize`` classes are cached.
+
+    Args:
+        maxsize: the maximum number of cached classes. ``None`` disables the limit.
+        module: the ``__module__`` of the created classes. Defaults to the module creating the factory.
+
+    Note:
+        Members of the created classes can only be pickled if their class can be found by name in ``module``
+        (eg: ``Food = factory('Food', Fruits)`` at the top level of the module).
+
+        Created classes keep a reference to their sources through ``__copied_from__``, so the source classes
+        are only released once all the classes created from them are evicted.
+    """
+
+    def __init__(self, maxsize=128, module=None):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must be None or a non-negative int!')
+        self.maxsize = maxsize
+        # noinspection PyProtectedMember
+        self.module = module if module is not None else _ext._caller_module()
+        self._cache = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, name: str, *sources, members=(), auto_null=False):
+        """
+        Returns the enum class copying the members of ``sources``.
+
+        Args:
+            name: the name of the class.
+            sources: the ``Enum`` class(es) to copy members from.
+            members: additional members, as a mapping or a sequence of name/value pairs.
+            auto_null: decorate the class with :func:`~extendableenum.auto_null_member`, using the current
+                module level auto null name and value.
+
+        Raises:
+            TypeError: if any of the sources is not an ``Enum``, or a member value is not hashable.
+        """
+        for source in sources:
+            if not isinstance(source, EnumMeta):
+                raise TypeError(f'Cannot copy enum members from non enum class {source}')
+        if hasattr(members, 'items'):
+            members = members.items()
+        members = tuple((member_name, value) for member_name, value in members)
+        null_config = (_ext._auto_null_member_name, _ext._auto_null_member_value) if auto_null else None
+        # values are keyed with their types, as equal values (eg: True and 1) create different members.
+        key = (name, sources, tuple((member_name, _typed_key(value)) for member_name, value in members),
+               null_config and (null_config[0], _typed_key(null_config[1])))
+
+        with self._lock:
+            new_enum = self._cache.get(key)
+            if new_enum is not None:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return new_enum
+            self._misses += 1
+
+        new_enum = _ext.copy_enum_members(*sources)(Enum(name, members, module=self.module))
+        if auto_null:
+            new_enum = _ext.auto_null_member(new_enum)
+
+        with self._lock:
+            # another thread may have created the same class in the meantime.
+            new_enum = self._cache.setdefault(key, new_enum)
+            self._cache.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return new_enum
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the hits, misses, maximum size and current size of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Clears the cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,225 @@
+import json
+import re
+from enum import Enum, EnumMeta
+
+from . import extendableenum as _ext
+from .extendableenum import enum_cache, all_members
+
+_skip_whitespace = re.compile(r'[ \t\n\r]*').match
+
+
+def _json_value(member):
+    """Returns the value a member is encoded as. The null member is encoded as ``None``."""
+    return None if member is getattr(member, '__null_member__', None) else member._value_
+
+
+@enum_cache
+def _json_texts(the_enum):
+    """Maps the ids of the members of the class to their JSON text."""
+    return {id(member): json.dumps(_json_value(member)) for member in all_members(the_enum)}
+
+
+@enum_cache
+def _value_table(the_enum):
+    """Maps the encoded values to the members of the class, and lists the members with unhashable values."""
+    table = {}
+    unhashable = []
+    for member in all_members(the_enum):
+        value = _json_value(member)
+        try:
+            table.setdefault(value, member)
+        except TypeError:
+            unhashable.append((value, member))
+    return table, unhashable
+
+
+class EnumJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for enum members.
+
+    Members are encoded as their value, except for the auto null member (see
+    :func:`~extendableenum.auto_null_member`) which is encoded as ``null``.
+
+    .. code-block:: python
+
+        json.dumps(data, cls=EnumJSONEncoder)
+    """
+
+    def default(self, o):
+        if isinstance(o, Enum):
+            return None if o is getattr(o, '__null_member__', None) else o._value_
+        return super().default(o)
+
+
+def iter_encode(members):
+    """
+    Encodes an iterable of enum members as a JSON array, one chunk at a time.
+
+    The JSON text of every member is computed once per class, so encoding a member is a single table lookup.
+    The members must belong to, or be inherited by, their class (ie: they cannot be pseudo-members).
+
+    Args:
+        members: an iterable of enum members.
+
+    Returns:
+        A generator of str chunks, which can be written to a file as they are produced.
+    """
+    texts = {}
+    yield '['
+    separator = ''
+    for member in members:
+        member_class = type(member)
+        table = texts.get(member_class)
+        if table is None:
+            table = texts[member_class] = _json_texts(member_class)
+        yield separator
+        yield table[id(member)]
+        separator = ', '
+    yield ']'
+
+
+class EnumDecoder:
+    """
+    Decodes JSON values to the members of an enum class.
+
+    Values are looked up in a table computed once per class, which includes the members hidden by
+    :func:`~extendableenum.inheritable_enum`. ``null`` is decoded to the auto null member, if the class has one.
+
+    Args:
+        the_enum: the ``Enum`` class.
+
+    Raises:
+        TypeError: if the class is not an ``Enum``.
+    """
+
+    def __init__(self, the_enum):
+        if not isinstance(the_enum, EnumMeta):
+            raise TypeError(f'Cannot decode values to non enum class {the_enum}')
+        self.enum = the_enum
+
+    def __call__(self, value):
+        """
+        Returns the member with the value.
+
+        Raises:
+            ValueError: if no member has the value.
+        """
+        table, unhashable = _value_table(self.enum)
+        try:
+            return table[value]
+        except KeyError:
+            pass
+        except TypeError:
+            for member_value, member in unhashable:
+                if member_value == value:
+                    return member
+        raise ValueError(f'{value!r} is not a valid {self.enum.__qualname__}')
+
+    def decode_many(self, values):
+        """Returns the list of members with the values. See :meth:`__call__`."""
+        table = _value_table(self.enum)[0]
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        try:
+            return [table[value] for value in values]
+        except (KeyError, TypeError):
+            return [self(value) for value in values]
+
+    def iter_decode(self, fp, chunk_size=65536):
+        """
+        Decodes a JSON array of values from a file, one member at a time.
+
+        Only one chunk of the file is held in memory at a time, so arbitrarily large arrays can be decoded.
+
+        Args:
+            fp: a text file containing a JSON array.
+            chunk_size: the number of characters read at a time.
+
+        Raises:
+            ValueError: if the file is not a JSON array, or a value is not valid.
+        """
+        raw_decode = json.JSONDecoder().raw_decode
+        table = _value_table(self.enum)[0]
+        buffer = ''
+        position = 0
+        eof = False
+
+        def read_more():
+            nonlocal buffer, position, eof
+            chunk = fp.read(chunk_size)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+
+        def next_character():
+            nonlocal position
+            position = _skip_whitespace(buffer, position).end()
+            while position == len(buffer) and not eof:
+                read_more()
+                position = _skip_whitespace(buffer, position).end()
+            return buffer[position:position + 1]
+
+        if next_character() != '[':
+            raise ValueError('Expected a JSON array!')
+        position += 1
+        if next_character() == ']':
+            return
+        while True:
+            next_character()
+            # a value is only complete once the next delimiter has been read (eg: '12' could be '123').
+            try:
+                value, end = raw_decode(buffer, position)
+                end = _skip_whitespace(buffer, end).end()
+                complete = end < len(buffer)
+            except json.JSONDecodeError:
+                complete = False
+            if not complete:
+                if eof:
+                    raise ValueError('Unterminated JSON array!')
+                read_more()
+                continue
+            try:
+                yield table[value]
+            except (KeyError, TypeError):
+                yield self(value)
+            delimiter = buffer[end]
+            if delimiter == ']':
+                return
+            if delimiter != ',':
+                raise ValueError(f'Expected , or ] in JSON array, got {delimiter!r}!')
+            position = end + 1
+
+
+def enum_object_hook(fields, object_hook=None):
+    """
+    Returns a JSON ``object_hook`` decoding the members of enum fields.
+
+    .. code-block:: python
+
+        json.loads(text, object_hook=enum_object_hook({'fruit': Fruit}))
+
+    Args:
+        fields: a mapping of field names to ``Enum`` classes. Objects with these fields have their values
+            replaced by the members, using an :class:`EnumDecoder`.
+        object_hook: an optional hook called on the objects after the enum fields are decoded.
+    """
+    versions = _ext._enum_versions
+    # the value table of every field is kept along with the version it was built for, and only looked up
+    # again once the class has been modified.
+    decoders = [[name, id(the_enum), (None, None), EnumDecoder(the_enum)] for name, the_enum in fields.items()]
+
+    def hook(obj):
+        for field in decoders:
+            name, key, (version, table), decoder = field
+            if name in obj:
+                if versions.get(key, 0) != version:
+                    version = versions.get(key, 0)
+                    table = _value_table(decoder.enum)[0]
+                    field[2] = (version, table)
+                value = obj[name]
+                try:
+                    obj[name] = table[value]
+                except (KeyError, TypeError):
+                    # unhashable or invalid values
+                    obj[name] = decoder(value)
+        return obj if object_hook is None else object_hook(obj)
+
+    return hook
@@ -0,0 +1,215 @@
+"""
+Profiles the cost of decorating enum classes.
+
+Run an application with the tracer installed and print the slowest decorated classes::
+
+    python -m extendableenum.profile [--sort {time,memory,members}] [--limit N] myapp [args ...]
+
+``myapp`` is either a module name (as for ``python -m``) or the path to a script.
+"""
+import argparse
+import os
+import runpy
+import sys
+import threading
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+from . import extendableenum as _ext
+
+DecorationRecord = namedtuple('DecorationRecord',
+                              ['decorator', 'module', 'qualname', 'members', 'rebuilt', 'seconds', 'allocated'])
+
+_TRACED_DECORATORS = ('inheritable_enum', 'auto_null_member', 'post_mixin_enum', 'copy_enum_members')
+_SORT_KEYS = {'time': lambda record: record.seconds,
+              'memory': lambda record: record.allocated,
+              'members': lambda record: record.members}
+
+
+class DecorationTracer:
+    """
+    Records the cost of every class decorated by the decorators of this package.
+
+    While the tracer is installed (see :meth:`install` or :func:`trace_decorations`), the decorators
+    :func:`~extendableenum.inheritable_enum`, :func:`~extendableenum.auto_null_member`,
+    :func:`~extendableenum.post_mixin_enum` and :func:`~extendableenum.copy_enum_members` are replaced in the
+    package namespace by wrappers recording a :class:`DecorationRecord` for each decorated class. The decorators
+    must therefore be imported by the application after the tracer is installed.
+
+    Decorators called by other decorators (eg: :func:`~extendableenum.auto_null_member` making a class
+    inheritable) are included in the record of the outer decorator.
+
+    ``allocated`` is the peak memory allocated while decorating the class, in bytes, so memory released by the
+    decorator (eg: a rebuilt class replacing the original one) is not subtracted from it. The ``tracemalloc``
+    peak is reset for every decorated class.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._originals = {}
+        self._started_tracemalloc = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _measure(self, decorator_name, decorate, the_enum):
+        """Calls the decorator and records its cost, unless it is called by another traced decorator."""
+        if getattr(self._local, 'active', False):
+            return decorate(the_enum)
+        self._local.active = True
+        try:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                start = perf_counter()
+                new_enum = decorate(the_enum)
+                seconds = perf_counter() - start
+                allocated = tracemalloc.get_traced_memory()[1] - before
+            else:
+                # Python < 3.9: the new allocations which are still alive afterwards.
+                snapshot = tracemalloc.take_snapshot()
+                start = perf_counter()
+                new_enum = decorate(the_enum)
+                seconds = perf_counter() - start
+                allocated = sum(max(stat.size_diff, 0)
+                                for stat in tracemalloc.take_snapshot().compare_to(snapshot, 'lineno'))
+        finally:
+            self._local.active = False
+        record = DecorationRecord(decorator_name, new_enum.__module__, new_enum.__qualname__,
+                                  len(_ext.all_members(new_enum)), new_enum is not the_enum, seconds, allocated)
+        with self._lock:
+            self.records.append(record)
+        return new_enum
+
+    def _wrap(self, name, decorator):
+        if name == 'copy_enum_members':
+            @wraps(decorator)
+            def traced(*args):
+                add_members = decorator(*args)
+                return wraps(add_members)(lambda derived_enum: self._measure(name, add_members, derived_enum))
+        elif name == 'post_mixin_enum':
+            # the enum is modified when the mixin is inserted, the mixin itself is returned.
+            @wraps(decorator)
+            def traced(the_enum):
+                insert_class = decorator(the_enum)
+
+                def insert(new_mixin):
+                    def decorate(_):
+                        insert_class(new_mixin)
+                        return the_enum
+
+                    self._measure(name, decorate, the_enum)
+                    return new_mixin
+
+                return insert
+        else:
+            @wraps(decorator)
+            def traced(the_enum):
+                return self._measure(name, decorator, the_enum)
+        return traced
+
+    def install(self):
+        """Replaces the decorators with the tracing wrappers and starts ``tracemalloc`` if needed."""
+        if self._originals:
+            return
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+        package = sys.modules[__package__]
+        for name in _TRACED_DECORATORS:
+            self._originals[name] = getattr(_ext, name)
+            traced = self._wrap(name, self._originals[name])
+            setattr(_ext, name, traced)
+            setattr(package, name, traced)
+
+    def uninstall(self):
+        """Restores the original decorators."""
+        package = sys.modules[__package__]
+        for name, decorator in self._originals.items():
+            setattr(_ext, name, decorator)
+            setattr(package, name, decorator)
+        self._originals = {}
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def report(self, sort='time', limit=None) -> list:
+        """
+        Returns the records, most expensive first.
+
+        Args:
+            sort: ``time``, ``memory`` or ``members``.
+            limit: the maximum number of records returned.
+        """
+        records = sorted(self.records, key=_SORT_KEYS[sort], reverse=True)
+        return records[:limit] if limit is not None else records
+
+    def format_report(self, sort='time', limit=None) -> str:
+        """Returns the report as a table. See :meth:`report`."""
+        lines = [f'{"time (ms)":>10} {"alloc (KiB)":>12} {"members":>8} {"rebuilt":>8}  {"decorator":<18} class']
+        for record in self.report(sort, limit):
+            lines.append(f'{record.seconds * 1000:10.3f} {record.allocated / 1024:12.1f} {record.members:8d} '
+                         f'{"yes" if record.rebuilt else "no":>8}  {record.decorator:<18} '
+                         f'{record.module}.{record.qualname}')
+        total = sum(record.seconds for record in self.records)
+        lines.append(f'{len(self.records)} decorated classes, {total * 1000:.3f} ms in total')
+        return '\n'.join(lines)
+
+
+@contextmanager
+def trace_decorations():
+    """
+    Context manager installing a :class:`DecorationTracer`.
+
+    .. code-block:: python
+
+        with trace_decorations() as tracer:
+            import myapp
+        print(tracer.format_report())
+    """
+    tracer = DecorationTracer()
+    tracer.install()
+    try:
+        yield tracer
+    finally:
+        tracer.uninstall()
+
+
+def main(argv=None):
+    """
+    Runs an application with a :class:`DecorationTracer` installed and prints the report to stderr.
+
+    ``sys.argv`` and ``sys.path`` are restored afterwards, and the ``SystemExit`` of the application is raised again with its
+    exit code once the report is printed.
+    """
+    parser = argparse.ArgumentParser(prog='python -m extendableenum.profile',
+                                     description='Reports the cost of decorating enum classes in an application.')
+    parser.add_argument('--sort', choices=sorted(_SORT_KEYS), default='time')
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('target', help='module name or script path')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='arguments passed to the application')
+    options = parser.parse_args(argv)
+
+    original_argv, original_path = sys.argv, list(sys.path)
+    sys.argv = [options.target] + options.args
+    if options.target.endswith('.py'):
+        # as when running python script.py, the modules next to the script can be imported.
+        sys.path.insert(0, os.path.dirname(os.path.abspath(options.target)))
+    try:
+        with trace_decorations() as tracer:
+            try:
+                if options.target.endswith('.py'):
+                    runpy.run_path(options.target, run_name='__main__')
+                else:
+                    runpy.run_module(options.target, run_name='__main__', alter_sys=True)
+            finally:
+                print(tracer.format_report(options.sort, options.limit), file=sys.stderr)
+    finally:
+        sys.argv = original_argv
+        sys.path[:] = original_path
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+import csv
+import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+from . import extendableenum as _ext
+
+_SCHEMA_SUFFIXES = ('.json', '.csv')
+_CACHE_FORMAT = 1
+
+
+def _schema_files(path):
+    """Returns the schema files at the path, which may be a file or a directory."""
+    if os.path.isdir(path):
+        return [os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.endswith(_SCHEMA_SUFFIXES)]
+    return [path]
+
+
+def _normalize_entry(entry, file_name):
+    """Checks a schema entry and fills in the optional keys."""
+    if not isinstance(entry, dict) or not isinstance(entry.get('name'), str):
+        raise ValueError(f'{file_name}: schema entries must be objects with a str name!')
+    members = entry.get('members', [])
+    if isinstance(members, dict):
+        members = list(members.items())
+    copy = entry.get('copy', [])
+    if isinstance(copy, str):
+        copy = [copy]
+    return {'name': entry['name'],
+            'members': [(name, value) for name, value in members],
+            'copy': list(copy),
+            'extends': entry.get('extends'),
+            'inheritable': bool(entry.get('inheritable', False)),
+            'auto_null': bool(entry.get('auto_null', False))}
+
+
+def _parse_json(file_name):
+    with open(file_name, encoding='utf-8') as schema_file:
+        data = json.load(schema_file)
+    if isinstance(data, dict):
+        data = data.get('enums', [])
+    return [_normalize_entry(entry, file_name) for entry in data]
+
+
+def _parse_csv_value(value):
+    """CSV values are read as JSON literals where possible (eg: ``1``, ``null``), otherwise as str."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _parse_csv(file_name):
+    entries = {}
+    with open(file_name, newline='', encoding='utf-8') as schema_file:
+        for row in csv.DictReader(schema_file):
+            entry = entries.setdefault(row['enum'], _normalize_entry({'name': row['enum']}, file_name))
+            entry['members'].append((row['name'], _parse_csv_value(row['value'])))
+    return list(entries.values())
+
+
+def _signature(files):
+    """Identifies the state of the schema files, used to validate the binary cache."""
+    signature = []
+    for file_name in files:
+        stat = os.stat(file_name)
+        signature.append((os.path.abspath(file_name), stat.st_mtime_ns, stat.st_size))
+    return signature
+
+
+def load_schema(path, cache_path=None):
+    """
+    Parses enum definitions from schema files.
+
+    The schema may be a single file, or a directory in which case all ``.json`` and ``.csv`` files are read.
+    JSON files contain a list of entries (or an object with an ``enums`` list). Each entry is an object with
+    the keys:
+
+    - ``name``: the name of the enum class.
+    - ``members``: an object or a list of name/value pairs. Optional.
+    - ``copy``: the name(s) of the enums to copy members from (see :func:`~extendableenum.copy_enum_members`).
+      Optional.
+    - ``extends``: the name of the inheritable enum to subclass. Optional.
+    - ``inheritable``: apply :func:`~extendableenum.inheritable_enum`. Optional.
+    - ``auto_null``: apply :func:`~extendableenum.auto_null_member`. Optional.
+
+    CSV files only define members, with one row per member and the columns ``enum``, ``name`` and ``value``.
+
+    Args:
+        path: the schema file or directory.
+        cache_path: if given, the parsed schema is stored in this file and reused by later calls as long as
+            the schema files are unchanged.
+
+    Raises:
+        ValueError: if an entry is malformed or an enum is defined more than once.
+    """
+    files = _schema_files(path)
+    signature = _signature(files)
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                cached = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cached = None
+        if isinstance(cached, dict) and cached.get('format') == _CACHE_FORMAT \
+                and cached.get('signature') == signature:
+            return cached['entries']
+
+    entries = []
+    seen = set()
+    for file_name in files:
+        parsed = _parse_csv(file_name) if file_name.endswith('.csv') else _parse_json(file_name)
+        for entry in parsed:
+            if entry['name'] in seen:
+                raise ValueError(f"{file_name}: enum '{entry['name']}' is defined more than once!")
+            seen.add(entry['name'])
+            entries.append(entry)
+
+    if cache_path is not None:
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump({'format': _CACHE_FORMAT, 'signature': signature, 'entries': entries}, cache_file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    return entries
+
+
+def _dependencies(entry):
+    return entry['copy'] + ([entry['extends']] if entry['extends'] else [])
+
+
+def _build_order(entries, known):
+    """Orders the entries so that every enum is built after the enums it copies or extends."""
+    by_name = {entry['name']: entry for entry in entries}
+    order = []
+    state = {}
+    for root in by_name:
+        stack = [(root, False)]
+        while stack:
+            name, done = stack.pop()
+            if done:
+                state[name] = 'built'
+                order.append(by_name[name])
+                continue
+            if state.get(name) == 'built':
+                continue
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Circular copy/extends relationship involving enum '{name}'!")
+            state[name] = 'visiting'
+            stack.append((name, True))
+            for dependency in _dependencies(by_name[name]):
+                if dependency in by_name:
+                    if state.get(dependency) != 'built':
+                        stack.append((dependency, False))
+                elif dependency not in known:
+                    raise ValueError(f"Enum '{name}' depends on unknown enum '{dependency}'!")
+    return order
+
+
+def _families(order):
+    """Splits the ordered entries into families of related enums. Families do not depend on each other."""
+    parent = {entry['name']: entry['name'] for entry in order}
+
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for entry in order:
+        for dependency in _dependencies(entry):
+            if dependency in parent:
+                parent[find(dependency)] = find(entry['name'])
+    families = {}
+    for entry in order:
+        families.setdefault(find(entry['name']), []).append(entry)
+    return list(families.values())
+
+
+def _build_enum(entry, registry, module):
+    """Creates the enum for a schema entry, creating the class only once."""
+    copied_from = tuple(registry[name] for name in entry['copy'])
+    base = registry[entry['extends']] if entry['extends'] else Enum
+    defined_names = {name for name, _ in entry['members']}
+    for source in copied_from:
+        defined_names.update(source.__members__)
+
+    # The members are laid out as the decorators would leave them, so that auto_null_member has no
+    # need to rebuild the class.
+    names = []
+    if entry['auto_null'] and _ext._auto_null_member_name not in defined_names:
+        names.append((_ext._auto_null_member_name, _ext._auto_null_member_value))
+    for source in copied_from:
+        names += [(name, member.value) for name, member in source.__members__.items()]
+    names += entry['members']
+
+    new_enum = base(entry['name'], names, module=module)
+    if entry['auto_null']:
+        new_enum = _ext.auto_null_member(new_enum)
+    if copied_from:
+        setattr(new_enum, '__copied_from__', copied_from)
+        # noinspection PyProtectedMember
+        _ext._add_lookup_methods(new_enum)
+        # noinspection PyProtectedMember
+        _ext._assign_codes(new_enum)
+    # noinspection PyProtectedMember
+    _ext._add_code_hash(new_enum)
+    if entry['inheritable'] and not hasattr(new_enum, '__inheritable_members__'):
+        new_enum = _ext.inheritable_enum(new_enum)
+    return new_enum
+
+
+def _build_family(family, known, module):
+    built = {}
+    lookup = dict(known)
+    for entry in family:
+        lookup[entry['name']] = built[entry['name']] = _build_enum(entry, lookup, module)
+    return built
+
+
+def build_enums(path, cache_path=None, known=None, module=None, max_workers=None):
+    """
+    Creates all the enums defined in schema files.
+
+    The schema is read with :func:`load_schema`. Enums are created after the enums they copy or extend, and each
+    class is only created once.
+
+    Args:
+        path: the schema file or directory.
+        cache_path: the binary cache of the parsed schema (see :func:`load_schema`).
+        known: a mapping of names to existing ``Enum`` classes, which can be copied or extended by the schema.
+        module: the ``__module__`` of the created classes. Defaults to the module calling this function. Members
+            can only be pickled if their class can be found by name in this module.
+        max_workers: if given, enum families which do not depend on each other are created in parallel
+            using a thread pool of this size.
+
+    Returns:
+        A dict mapping the names to the created ``Enum`` classes.
+
+    Raises:
+        ValueError: if the schema is invalid, refers to unknown enums, or has circular relationships.
+    """
+    if module is None:
+        # noinspection PyProtectedMember
+        module = _ext._caller_module()
+    known = dict(known or {})
+    order = _build_order(load_schema(path, cache_path), known)
+    registry = {}
+    if max_workers is None:
+        for family in _families(order):
+            registry.update(_build_family(family, known, module))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for built in executor.map(lambda family: _build_family(family, known, module), _families(order)):
+                registry.update(built)
+    return registry
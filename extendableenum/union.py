@@ -0,0 +1,111 @@
+from collections import namedtuple
+from enum import EnumMeta
+
+from .extendableenum import enum_cache, all_members
+
+UnionMatch = namedtuple('UnionMatch', ['source', 'member', 'copied'])
+
+
+def _add_origins(the_enum, origins, unhashable):
+    """Adds the values of the class to the tables, after the values of the classes it copied members from."""
+    for source in vars(the_enum).get('__copied_from__', ()):
+        _add_origins(source, origins, unhashable)
+    for member in all_members(the_enum):
+        try:
+            origins.setdefault(member.value, (the_enum, member))
+        except TypeError:
+            unhashable.append((member.value, (the_enum, member)))
+
+
+@enum_cache
+def _union_table(the_enum):
+    """Maps the values of the class to the class and member that originally defined them, and to its member."""
+    origins = {}
+    unhashable_origins = []
+    _add_origins(the_enum, origins, unhashable_origins)
+
+    copies = {}
+    for member in all_members(the_enum):
+        try:
+            copies.setdefault(member.value, member)
+        except TypeError:
+            pass
+    table = {value: UnionMatch(source, member, copies[value])
+             for value, (source, member) in origins.items() if value in copies}
+    unhashable = []
+    for value, (source, member) in unhashable_origins:
+        copy = next((copy for copy in all_members(the_enum) if copy.value == value), None)
+        if copy is not None:
+            unhashable.append((value, UnionMatch(source, member, copy)))
+    return table, unhashable
+
+
+class UnionDecoder:
+    """
+    Decodes values to the members of an enum and of the enums its members were copied from.
+
+    For an enum created with :func:`~extendableenum.copy_enum_members`, the decoder follows the
+    ``__copied_from__`` chain (including sources which copied their own members) and resolves a value to a
+    :class:`UnionMatch` of:
+
+    - ``source``: the enum class which originally defined the value.
+    - ``member``: the member of the source class.
+    - ``copied``: the member of the decoded enum with the value.
+
+    The matches are precomputed once per class, so decoding a value is a single table lookup. If several
+    sources define the same value, the first source (in the order passed to
+    :func:`~extendableenum.copy_enum_members`) is used.
+
+    Args:
+        the_enum: the ``Enum`` class.
+
+    Raises:
+        TypeError: if the class is not an ``Enum``.
+    """
+
+    def __init__(self, the_enum):
+        if not isinstance(the_enum, EnumMeta):
+            raise TypeError(f'Cannot decode values to non enum class {the_enum}')
+        self.enum = the_enum
+
+    def get(self, value, default=None):
+        """Returns the :class:`UnionMatch` for the value, or ``default`` if there is none."""
+        table, unhashable = _union_table(self.enum)
+        try:
+            return table.get(value, default)
+        except TypeError:
+            for member_value, match in unhashable:
+                if member_value == value:
+                    return match
+            return default
+
+    def __call__(self, value):
+        """
+        Returns the :class:`UnionMatch` for the value.
+
+        Raises:
+            ValueError: if no member has the value.
+        """
+        match = self.get(value)
+        if match is None:
+            raise ValueError(f'{value!r} is not a valid {self.enum.__qualname__} or source value')
+        return match
+
+    def decode_many(self, values):
+        """Returns the list of :class:`UnionMatch` for the values. See :meth:`__call__`."""
+        table = _union_table(self.enum)[0]
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        try:
+            return [table[value] for value in values]
+        except (KeyError, TypeError):
+            return [self(value) for value in values]
+
+    def iter_decode(self, values):
+        """Returns a generator of :class:`UnionMatch` for an iterable of values. See :meth:`__call__`."""
+        table = _union_table(self.enum)[0]
+        for value in values:
+            try:
+                match = table[value]
+            except (KeyError, TypeError):
+                match = self(value)
+            yield match
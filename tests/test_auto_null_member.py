@@ -1,7 +1,8 @@
 import unittest
 import extendableenum
 from extendableenum.extendableenum import auto_null_member, _auto_null_member_value, _auto_null_member_name, \
-    AutoNullEnum, set_auto_null
+    AutoNullEnum, set_auto_null, filter_valid, null_mask
+from extendableenum import copy_enum_members
 from enum import Enum
 
 
@@ -152,6 +153,37 @@ class TestAutoNullMember(unittest.TestCase):
         self.assertTrue(Undecorated.A)
         self.assertTrue(Decorated.A)
 
+        # test is_null property inherited from AutoNullEnum
+        self.assertTrue(Undecorated.NULL.is_null and Decorated.NULL.is_null)
+        self.assertFalse(Undecorated.A.is_null or Decorated.A.is_null)
+
+    def test_autonull_cached_member(self):
+        @auto_null_member
+        class AutoNull(Enum):
+            A = 1
+            B = 2
+
+        # the null member is cached on the class
+        self.assertIs(AutoNull.__null_member__, AutoNull.NULL)
+
+        # rebuilding the class looks up the null member of the new class
+        class Base(Enum):
+            C = 3
+
+        @copy_enum_members(Base)
+        @auto_null_member
+        class Copied(Enum):
+            D = 4
+
+        self.assertIs(Copied.__null_member__, Copied.NULL)
+
+        class Plain(Enum):
+            X = 1
+
+        members = [AutoNull.A, AutoNull.NULL, Plain.X, AutoNullEnum.NULL, AutoNull.B]
+        self.assertListEqual(filter_valid(members), [AutoNull.A, Plain.X, AutoNull.B])
+        self.assertListEqual(null_mask(iter(members)), [False, True, False, True, False])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from extendableenum import auto_null_member, inheritable_enum, save_code_table, open_code_table, AutoNullEnum
+from enum import Enum, IntEnum
+
+
+@auto_null_member
+class Code(Enum):
+    A = 1
+    B = 'b'
+    C = 2.5
+    D = b'd'
+    E = False
+    ALIAS_A = 1
+
+
+class TestCodeTable(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'codes.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookups(self):
+        """Test lookups against the mapped table, without creating the enum."""
+        save_code_table(Code, self.path)
+        with open_code_table(self.path) as table:
+            self.assertEqual(table.name, 'Code')
+            self.assertEqual(len(table), 6)
+            self.assertListEqual(list(table.names()), ['NULL', 'A', 'B', 'C', 'D', 'E'])
+            self.assertIn('C', table)
+            self.assertNotIn('ALIAS_A', table)
+            self.assertEqual(table.value_of('B'), 'b')
+            self.assertIsNone(table.value_of('NULL', 'missing'))
+            self.assertEqual(table.value_of('Z', 'missing'), 'missing')
+            self.assertEqual(table.name_of(1), 'A')
+            self.assertEqual(table.name_of(2.5), 'C')
+            self.assertEqual(table.name_of(b'd'), 'D')
+            self.assertEqual(table.name_of(False), 'E')
+            # equal values match, as for Enum lookups
+            self.assertEqual(table.name_of(1.0), 'A')
+            self.assertEqual(table.name_of(0), 'E')
+            self.assertEqual(table.name_of(None), 'NULL')
+            self.assertIsNone(table.name_of(3))
+            self.assertIsNone(table.name_of([1]))
+            # the enum has not been created
+            self.assertIsNone(table._enum)
+
+    def test_members(self):
+        """Test creating the members on first access."""
+        save_code_table(Code, self.path)
+        with open_code_table(self.path) as table:
+            member = table['B']
+            Loaded = table.enum
+            self.assertIs(member, Loaded.B)
+            self.assertIsNot(Loaded, Code)
+            self.assertEqual(Loaded.__qualname__, 'Code')
+            self.assertListEqual([(m.name, m.value) for m in Loaded], [(m.name, m.value) for m in Code])
+            self.assertIs(Loaded.__null_member__, Loaded.NULL)
+            self.assertIs(table.member(2.5), Loaded.C)
+            self.assertEqual(hash(Loaded.C), Loaded.C._hash_)
+            self.assertIsNone(table.member(3))
+            self.assertRaises(KeyError, table.__getitem__, 'Z')
+
+    def test_large_and_inheritable(self):
+        """Test a large table, and an inheritable enum."""
+        Large = Enum('Large', [(f'CODE_{i}', i) for i in range(20000)])
+        save_code_table(Large, self.path)
+        with open_code_table(self.path) as table:
+            self.assertEqual(len(table), 20000)
+            self.assertEqual(table.name_of(12345), 'CODE_12345')
+            self.assertEqual(table.value_of('CODE_19999'), 19999)
+
+        @inheritable_enum
+        class Base(Enum):
+            A = 1
+
+        save_code_table(Base, self.path)
+        with open_code_table(self.path) as table:
+            self.assertEqual(table.name_of(1), 'A')
+
+    def test_types(self):
+        """Test recreating mixed-in enums, and inherited auto null configurations."""
+
+        class Number(IntEnum):
+            ONE = 1
+            TWO = 2
+
+        save_code_table(Number, self.path)
+        with open_code_table(self.path) as table:
+            Loaded = table.enum
+            self.assertTrue(issubclass(Loaded, IntEnum))
+            self.assertEqual(Loaded.TWO + 1, 3)
+            self.assertIs(Loaded(1.0), Loaded.ONE)
+            self.assertIs(Loaded.get(3, 'missing'), 'missing')
+
+        class Text(str, Enum):
+            A = 'a'
+
+        save_code_table(Text, self.path)
+        with open_code_table(self.path) as table:
+            self.assertEqual(table['A'].upper(), 'A')
+            # members of mixed-in types hash like their values
+            self.assertEqual(hash(table['A']), hash('a'))
+
+        class Color(AutoNullEnum):
+            RED = 1
+
+        save_code_table(Color, self.path)
+        with open_code_table(self.path) as table:
+            Loaded = table.enum
+            self.assertIs(Loaded.__null_member__, Loaded.NULL)
+            self.assertIs(Loaded.get(3), Loaded.NULL)
+            # the class is recreated from AutoNullEnum, so the members behave the same
+            self.assertTrue(issubclass(Loaded, AutoNullEnum))
+            self.assertIs(bool(Loaded.NULL), False)
+            self.assertIs(bool(Loaded.RED), True)
+            self.assertTrue(Loaded.NULL.is_null)
+            self.assertListEqual([member.name for member in Loaded], ['RED'])
+
+    def test_invalid(self):
+        """Test unsupported values and files."""
+        Unsupported = Enum('Unsupported', [('A', (1, 2))])
+        self.assertRaises(TypeError, save_code_table, Unsupported, self.path)
+        self.assertRaises(TypeError, save_code_table, object, self.path)
+        Mixed = Enum('Mixed', [('A', 1)], type=complex)
+        self.assertRaises(TypeError, save_code_table, Mixed, self.path)
+        with open(self.path, 'wb') as table_file:
+            table_file.write(b'not a code table')
+        self.assertRaises(ValueError, open_code_table, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
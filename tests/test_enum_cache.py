@@ -0,0 +1,95 @@
+import gc
+import unittest
+import weakref
+from extendableenum import enum_version, invalidate_enum, enum_cache, \
+    inheritable_enum, auto_null_member, post_mixin_enum, all_members
+from enum import Enum
+
+
+class TestEnumCache(unittest.TestCase):
+    def test_enum_version(self):
+        """Test the modification counter of decorated enums."""
+
+        class TestEnum(Enum):
+            A = 1
+            B = 2
+
+        # undecorated enums start at 0
+        self.assertEqual(enum_version(TestEnum), 0)
+
+        # decorating, restoring and mixing in all increment the counter
+        inheritable_enum(TestEnum)
+        self.assertEqual(enum_version(TestEnum), 1)
+
+        class Derived(TestEnum):
+            C = 3
+
+        TestEnum.restore()
+        self.assertEqual(enum_version(TestEnum), 2)
+        # modifying a base class also increments the counter of its subclasses
+        self.assertEqual(enum_version(Derived), 1)
+
+        @post_mixin_enum(TestEnum)
+        class Mixin:
+            pass
+
+        self.assertEqual(enum_version(TestEnum), 3)
+
+        # auto_null_member increments the counter of the returned class
+        @auto_null_member
+        class NullEnum(Enum):
+            NULL = None
+            A = 1
+
+        self.assertEqual(enum_version(NullEnum), 1)
+
+        # the counter can be incremented manually
+        invalidate_enum(NullEnum)
+        self.assertEqual(enum_version(NullEnum), 2)
+
+    def test_enum_cache(self):
+        """Test values cached with enum_cache."""
+        calls = []
+
+        @enum_cache
+        def member_names(the_enum):
+            calls.append(the_enum)
+            return list(the_enum.__members__)
+
+        @inheritable_enum
+        class Base(Enum):
+            A = 1
+            B = 2
+
+        class Derived(Base):
+            C = 3
+
+        # values are computed once per class
+        self.assertIs(member_names(Base), member_names(Base))
+        self.assertListEqual(member_names(Derived), ['C'])
+        self.assertListEqual(calls, [Base, Derived])
+
+        # modifying the base class recomputes the values of the class and its subclasses
+        Base.restore()
+        member_names(Base)
+        member_names(Derived)
+        self.assertListEqual(calls, [Base, Derived, Base, Derived])
+
+    def test_enum_cache_release(self):
+        """Test that cached values do not keep their class alive."""
+
+        @inheritable_enum
+        class Temporary(Enum):
+            A = 1
+            B = 2
+
+        # the cached value references the members, and through them the class
+        self.assertEqual(len(all_members(Temporary)), 2)
+        reference = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+        self.assertIsNone(reference())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+from collections import Counter
+from extendableenum import inheritable_enum, auto_null_member, post_mixin_enum, copy_enum_members, \
+    enum_code, EnumCounter
+from enum import Enum, Flag
+
+
+class TestEnumCodes(unittest.TestCase):
+    def test_codes(self):
+        """Test that inherited members keep their codes and subclass members are numbered after them."""
+
+        @inheritable_enum
+        class Base(Enum):
+            A = 1
+            B = 2
+
+        @inheritable_enum
+        class Derived(Base):
+            C = 3
+
+        self.assertEqual([enum_code(member) for member in (Base.A, Base.B, Derived.C)], [0, 1, 2])
+        self.assertIs(Derived.A, Base.A)
+        self.assertEqual({Base.A: 'a', Derived.C: 'c'}[Derived.A], 'a')
+
+    def test_copied_codes(self):
+        """Test that copied members are numbered in the order they are copied."""
+
+        class First(Enum):
+            A = 1
+            B = 2
+
+        @copy_enum_members(First)
+        class Copied(Enum):
+            C = 3
+
+        self.assertEqual([enum_code(member) for member in Copied], [0, 1, 2])
+        self.assertEqual(enum_code(First.B), 1)
+
+    def test_hash(self):
+        """Test that decorating a class in place does not change the hash of its members."""
+
+        class Plain(Enum):
+            A = 1
+            B = 2
+
+        keys = {Plain.A: 'a'}
+        members = {Plain.B}
+        inheritable_enum(Plain)
+        self.assertIn(Plain.A, keys)
+        self.assertIn(Plain.B, members)
+
+        @inheritable_enum
+        class Text(str, Enum):
+            A = 'a'
+
+        self.assertEqual(hash(Text.A), hash('a'))
+        self.assertEqual(enum_code(Text.A), 0)
+
+        class Mixin:
+            pass
+
+        class Mixed(Enum):
+            A = 1
+
+        expected = hash(Mixed.A)
+        post_mixin_enum(Mixed)(Mixin)
+        self.assertEqual(hash(Mixed.A), expected)
+
+    def test_code_hash(self):
+        """Test that the classes created by the decorators hash their members by code."""
+
+        @auto_null_member
+        class AutoNull(Enum):
+            A = 1
+
+        self.assertEqual(hash(AutoNull.A), AutoNull.A._hash_)
+        self.assertEqual(sorted(enum_code(member) for member in (AutoNull.A, AutoNull.NULL)), [0, 1])
+
+        class Source(Enum):
+            A = 1
+
+        @copy_enum_members(Source)
+        class Copied(Enum):
+            B = 2
+
+        self.assertEqual(hash(Copied.B), Copied.B._hash_)
+        self.assertDictEqual({member: member.value for member in Copied}, {Copied.A: 1, Copied.B: 2})
+        self.assertNotEqual(hash(Copied.A), hash(Source.A))
+
+    def test_flag_combinations(self):
+        """Test that combinations of flags can be hashed, and have no code."""
+
+        class Source(Flag):
+            A = 1
+            B = 2
+
+        @copy_enum_members(Source)
+        class Combined(Flag):
+            C = 4
+
+        combination = Combined.A | Combined.C
+        self.assertEqual(hash(Combined.C), Combined.C._hash_)
+        self.assertEqual({combination: 'ac'}[Combined.A | Combined.C], 'ac')
+        self.assertEqual(enum_code(Combined.C), 2)
+        with self.assertRaises(ValueError):
+            enum_code(combination)
+
+
+class TestEnumCounter(unittest.TestCase):
+    def test_counter(self):
+        """Test counting members, including inherited members."""
+
+        @inheritable_enum
+        class Base(Enum):
+            A = 1
+            B = 2
+
+        @inheritable_enum
+        class Derived(Base):
+            C = 3
+
+        counter = EnumCounter(Derived, [Derived.C, Base.A, Derived.C])
+        counter.add(Derived.B)
+        self.assertEqual(counter[Derived.C], 2)
+        self.assertEqual(counter[Derived.A], 1)
+        self.assertEqual(counter.total(), 4)
+        self.assertEqual(counter.most_common(1), [(Derived.C, 2)])
+        self.assertEqual(counter.items(), [(Base.A, 1), (Base.B, 1), (Derived.C, 2)])
+        self.assertEqual(counter.to_counter(), Counter([Base.A, Base.B, Derived.C, Derived.C]))
+        self.assertIn(Base.A, counter)
+        counter.clear()
+        self.assertNotIn(Base.A, counter)
+        self.assertEqual(len(counter), 0)
+
+    def test_invalid_members(self):
+        """Test that foreign members are rejected without counting anything."""
+
+        class Fruit(Enum):
+            APPLE = 1
+
+        class Vegetable(Enum):
+            LEEK = 1
+
+        counter = EnumCounter(Fruit)
+        with self.assertRaises(ValueError):
+            counter.update([Fruit.APPLE, Vegetable.LEEK])
+        self.assertEqual(counter.total(), 0)
+        with self.assertRaises(ValueError):
+            counter.add(Vegetable.LEEK)
+        with self.assertRaises(TypeError):
+            EnumCounter(int)
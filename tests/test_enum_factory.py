@@ -0,0 +1,101 @@
+import gc
+import pickle
+import unittest
+import weakref
+from extendableenum import EnumFactory
+from enum import Enum
+
+
+class Source(Enum):
+    A = 1
+
+
+Picklable = EnumFactory()('Picklable', Source, members={'B': 2})
+
+
+class TestEnumFactory(unittest.TestCase):
+    def test_create(self):
+        """Test creating enums with the factory."""
+
+        class Base1(Enum):
+            A = 1
+            B = 2
+
+        class Base2(Enum):
+            C = 3
+
+        factory = EnumFactory()
+        Derived = factory('Derived', Base1, Base2, members={'D': 4})
+
+        self.assertListEqual(Derived._member_names_, ['A', 'B', 'C', 'D'])
+        self.assertTupleEqual(Derived.__copied_from__, (Base1, Base2))
+        self.assertIsNot(Derived.A, Base1.A)
+
+        NullDerived = factory('NullDerived', Base1, auto_null=True)
+        self.assertListEqual(NullDerived._member_names_, ['NULL', 'A', 'B'])
+
+        # non-enum sources raise a TypeError
+        self.assertRaises(TypeError, factory, 'Bad', object)
+
+    def test_memoize(self):
+        """Test memoization and statistics."""
+
+        class Base(Enum):
+            A = 1
+
+        factory = EnumFactory(maxsize=2)
+        first = factory('Derived', Base, members=[('B', 2)])
+        # identical definitions return the same class
+        self.assertIs(factory('Derived', Base, members=(('B', 2),)), first)
+        # different definitions return a different class
+        self.assertIsNot(factory('Derived', Base, members=[('B', 3)]), first)
+        self.assertIsNot(factory('Derived', Base, members=[('B', 2)], auto_null=True), first)
+        self.assertTupleEqual(tuple(factory.cache_info()), (1, 3, 2, 2))
+
+        # the least recently used class was evicted
+        self.assertIsNot(factory('Derived', Base, members=[('B', 2)]), first)
+
+        factory.cache_clear()
+        self.assertTupleEqual(tuple(factory.cache_info()), (0, 0, 2, 0))
+
+    def test_memo_key_types(self):
+        """Test that equal values of different types create different classes."""
+
+        class Base(Enum):
+            A = 1
+
+        factory = EnumFactory()
+        Flags = factory('Values', Base, members={'X': True})
+        Numbers = factory('Values', Base, members={'X': 1})
+        self.assertIsNot(Flags, Numbers)
+        self.assertIs(Numbers.X.value, 1)
+        self.assertIs(factory('Values', Base, members={'X': (True,)}).X.value[0], True)
+        self.assertIs(factory('Values', Base, members={'X': (1,)}).X.value[0], 1)
+
+    def test_pickle(self):
+        """Test that the created classes belong to the module creating the factory, so members can be pickled."""
+        self.assertEqual(Picklable.__module__, __name__)
+        self.assertIs(pickle.loads(pickle.dumps(Picklable.B)), Picklable.B)
+
+    def test_churn(self):
+        """Test that the number of live classes is bounded under a churn of definitions."""
+
+        class Base(Enum):
+            A = 1
+            B = 2
+
+        factory = EnumFactory(maxsize=32)
+        created = weakref.WeakSet()
+        for tenant in range(2000):
+            created.add(factory(f'Tenant{tenant}', Base, members={'C': tenant}))
+            # repeated definitions are served from the cache
+            factory(f'Tenant{tenant}', Base, members={'C': tenant})
+        gc.collect()
+
+        self.assertLessEqual(len(created), 32)
+        self.assertEqual(factory.cache_info().hits, 2000)
+        self.assertEqual(factory.cache_info().currsize, 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_package(code=''):
+    """Imports the package in a new interpreter with ``-X importtime``, returns the stdout and the timings."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [_PACKAGE_ROOT, os.environ.get('PYTHONPATH')])))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import extendableenum\n{code}'],
+                            capture_output=True, text=True, env=env, check=True)
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)', line)
+        if match:
+            timings[match.group(4)] = int(match.group(2))
+    return result.stdout, timings
+
+
+class TestImportTime(unittest.TestCase):
+    def test_lazy_import(self):
+        """Test that importing the package does not create AutoNullEnum or import the optional modules."""
+        stdout, timings = _import_package(
+            "import sys\n"
+            "print('AutoNullEnum' in vars(extendableenum.extendableenum))\n"
+            "print(sorted(name for name in sys.modules if name.startswith('extendableenum')))")
+        self.assertListEqual(stdout.splitlines(),
+                             ['False', "['extendableenum', 'extendableenum.extendableenum']"])
+        self.assertIn('extendableenum', timings)
+
+    def test_no_heavy_imports(self):
+        """Test that importing the package does not import threading or weakref, which cost more than the package."""
+        stdout, timings = _import_package(
+            "import sys\n"
+            "print('threading' in sys.modules, 'weakref' in sys.modules)")
+        self.assertEqual(stdout.strip(), 'False False')
+        self.assertNotIn('threading', timings)
+        self.assertNotIn('weakref', timings)
+
+    def test_lazy_attributes(self):
+        """Test that the lazy attributes are created on first access."""
+        stdout, _ = _import_package(
+            "from extendableenum import AutoNullEnum, EnumFactory\n"
+            "print(AutoNullEnum.__qualname__, AutoNullEnum.NULL.value, EnumFactory.__name__)\n"
+            "print(extendableenum.AutoNullEnum is extendableenum.extendableenum.AutoNullEnum)\n"
+            "print('AutoNullEnum' in dir(extendableenum))")
+        self.assertListEqual(stdout.splitlines(), ['AutoNullEnum None EnumFactory', 'True', 'True'])
+
+    def test_default_null_member(self):
+        """Test that AutoNullEnum uses the default null member even if the configuration changed before."""
+        stdout, _ = _import_package(
+            "extendableenum.set_auto_null('CUSTOM', 0)\n"
+            "print(extendableenum.AutoNullEnum.auto_null_name, extendableenum.AutoNullEnum.auto_null_value)")
+        self.assertEqual(stdout.strip(), 'NULL None')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from extendableenum import inheritable_enum
+from extendableenum import inheritable_enum, all_members
 from enum import Enum
 
 
@@ -90,6 +90,43 @@ class TestInheritableEnum(unittest.TestCase):
         # Enum members should be in _member_names_
         self.assertListEqual(TestEnum._member_names_, ['A', 'B'])
 
+    def test_all_members(self):
+        """Test the full member view of inheritable enums and their subclasses."""
+
+        @inheritable_enum
+        class Base(Enum):
+            A = 1
+            B = 2
+
+        class Derived(Base):
+            C = 3
+            ALIAS_C = 3
+            D = 4
+
+        # the view contains all members, inherited first, without aliases
+        self.assertTupleEqual(all_members(Base), (Base.A, Base.B))
+        self.assertTupleEqual(all_members(Derived), (Base.A, Base.B, Derived.C, Derived.D))
+        self.assertEqual(len(all_members(Derived)), 4)
+        # the view is cached
+        self.assertIs(all_members(Derived), all_members(Derived))
+
+        # the view is unchanged by restore, but recomputed
+        base_view = all_members(Base)
+        Base.restore()
+        self.assertIsNot(all_members(Base), base_view)
+        self.assertTupleEqual(all_members(Base), base_view)
+        self.assertTupleEqual(all_members(Derived), (Base.A, Base.B, Derived.C, Derived.D))
+
+        # undecorated enums return all of their members
+        class Plain(Enum):
+            X = 1
+            Y = 2
+
+        self.assertTupleEqual(all_members(Plain), tuple(Plain))
+
+        # non-enum classes raise a TypeError
+        self.assertRaises(TypeError, all_members, object)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,89 @@
+import io
+import json
+import unittest
+from extendableenum import inheritable_enum, auto_null_member, \
+    EnumJSONEncoder, EnumDecoder, iter_encode, enum_object_hook
+from enum import Enum
+
+
+@auto_null_member
+class Fruit(Enum):
+    APPLE = 1
+    BANANA = 'banana'
+    PEAR = [3]
+
+
+class TestJSONEnum(unittest.TestCase):
+    def test_encode(self):
+        """Test encoding members with the encoder."""
+        data = {'fruits': [Fruit.APPLE, Fruit.NULL, Fruit.BANANA, Fruit.PEAR], 'n': 1}
+        self.assertEqual(json.dumps(data, cls=EnumJSONEncoder),
+                         '{"fruits": [1, null, "banana", [3]], "n": 1}')
+        # other objects are still rejected
+        self.assertRaises(TypeError, json.dumps, object(), cls=EnumJSONEncoder)
+
+        # streaming encoding of an iterable of members
+        members = iter([Fruit.APPLE, Fruit.NULL, Fruit.PEAR])
+        self.assertEqual(''.join(iter_encode(members)), '[1, null, [3]]')
+        self.assertEqual(''.join(iter_encode([])), '[]')
+
+    def test_decode(self):
+        """Test decoding values with the decoder."""
+        decoder = EnumDecoder(Fruit)
+        self.assertIs(decoder(1), Fruit.APPLE)
+        self.assertIs(decoder(None), Fruit.NULL)
+        self.assertIs(decoder([3]), Fruit.PEAR)
+        self.assertRaises(ValueError, decoder, 2)
+        self.assertRaises(ValueError, decoder, [4])
+        self.assertListEqual(decoder.decode_many([1, None, [3]]), [Fruit.APPLE, Fruit.NULL, Fruit.PEAR])
+        # one-shot iterators are decoded completely even when a value is not in the value table
+        values = (value for value in [1, [3], None])
+        self.assertListEqual(decoder.decode_many(values), [Fruit.APPLE, Fruit.PEAR, Fruit.NULL])
+        self.assertRaises(TypeError, EnumDecoder, object)
+
+        hook = enum_object_hook({'fruit': Fruit})
+        self.assertDictEqual(json.loads('{"fruit": "banana", "n": 1}', object_hook=hook),
+                             {'fruit': Fruit.BANANA, 'n': 1})
+
+    def test_decode_inheritable(self):
+        """Test decoding values of inheritable enums and their subclasses."""
+
+        @inheritable_enum
+        class Base(Enum):
+            A = 1
+
+        class Derived(Base):
+            B = 2
+
+        decoder = EnumDecoder(Derived)
+        self.assertIs(decoder(1), Base.A)
+        self.assertIs(decoder(2), Derived.B)
+
+        # the object hook follows the modifications of the class
+        hook = enum_object_hook({'base': Base})
+        self.assertIs(json.loads('{"base": 1}', object_hook=hook)['base'], Base.A)
+        Base.restore()
+        self.assertIs(json.loads('{"base": 1}', object_hook=hook)['base'], Base.A)
+
+    def test_iter_decode(self):
+        """Test streaming decoding of JSON arrays."""
+        decoder = EnumDecoder(Fruit)
+        values = [1, None, 'banana', [3]] * 50
+        text = json.dumps(values, indent=1)
+        # small chunks split values across reads
+        for chunk_size in (1, 3, 7, 4096):
+            members = list(decoder.iter_decode(io.StringIO(text), chunk_size=chunk_size))
+            self.assertListEqual(members, decoder.decode_many(values))
+        # numbers split across chunks are not decoded early
+        decoder = EnumDecoder(Enum('Numbers', [('SMALL', 1), ('LARGE', 123)]))
+        self.assertListEqual([member.name for member in decoder.iter_decode(io.StringIO('[123, 1]'), 2)],
+                             ['LARGE', 'SMALL'])
+        self.assertListEqual(list(decoder.iter_decode(io.StringIO(' [ ] '))), [])
+
+        self.assertRaises(ValueError, list, decoder.iter_decode(io.StringIO('{}')))
+        self.assertRaises(ValueError, list, decoder.iter_decode(io.StringIO('[1, 1')))
+        self.assertRaises(ValueError, list, decoder.iter_decode(io.StringIO('[1 1]')))
+
+
+if __name__ == '__main__':
+    unittest.main()
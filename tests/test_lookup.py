@@ -0,0 +1,75 @@
+import unittest
+from extendableenum import inheritable_enum, auto_null_member, post_mixin_enum, copy_enum_members
+from enum import Enum
+
+
+class TestLookup(unittest.TestCase):
+    def test_get(self):
+        """Test value and name lookups without exceptions."""
+
+        @copy_enum_members()
+        class Plain(Enum):
+            A = 1
+            ALIAS_A = 1
+            B = [2]
+
+        self.assertIs(Plain.get(1), Plain.A)
+        self.assertIs(Plain.get([2]), Plain.B)
+        self.assertIsNone(Plain.get(3))
+        self.assertIsNone(Plain.get([3]))
+        self.assertEqual(Plain.get(3, 'missing'), 'missing')
+        self.assertIs(Plain.get_by_name('ALIAS_A'), Plain.A)
+        self.assertIsNone(Plain.get_by_name('C'))
+        self.assertEqual(Plain.get_by_name('C', 'missing'), 'missing')
+
+    def test_get_auto_null(self):
+        """Test that lookups return the null member by default."""
+
+        @auto_null_member
+        class AutoNull(Enum):
+            A = 1
+
+        self.assertIs(AutoNull.get(1), AutoNull.A)
+        self.assertIs(AutoNull.get(2), AutoNull.NULL)
+        self.assertIs(AutoNull.get(None), AutoNull.NULL)
+        self.assertIs(AutoNull.get_by_name('B'), AutoNull.NULL)
+        self.assertIsNone(AutoNull.get(2, None))
+
+    def test_get_inheritable(self):
+        """Test lookups of inherited members."""
+
+        @inheritable_enum
+        class Base(Enum):
+            A = 1
+
+        class Derived(Base):
+            B = 2
+
+        # the subclass inherits the lookup methods, and finds the inherited members
+        self.assertIs(Derived.get(1), Base.A)
+        self.assertIs(Derived.get(2), Derived.B)
+        self.assertIs(Derived.get_by_name('A'), Base.A)
+        self.assertIsNone(Base.get(2))
+
+        # the lookups follow restore
+        Base.restore()
+        self.assertIs(Base.get(1), Base.A)
+
+    def test_existing_attributes(self):
+        """Test that existing members and methods are not replaced."""
+
+        class Mixin:
+            @classmethod
+            def get(cls, value):
+                return 'mixin'
+
+        class Base(Enum):
+            get_by_name = 1
+
+        post_mixin_enum(Base)(Mixin)
+        self.assertEqual(Base.get(1), 'mixin')
+        self.assertIsInstance(Base.get_by_name, Base)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import extendableenum
+from extendableenum import trace_decorations
+from extendableenum.profile import main
+from enum import Enum
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+APPLICATION = '''
+from enum import Enum
+from extendableenum import auto_null_member
+
+
+@auto_null_member
+class SlowEnum(Enum):
+    A = 1
+'''
+
+
+class TestProfile(unittest.TestCase):
+    def test_trace_decorations(self):
+        """Test recording decorated classes."""
+        original = extendableenum.auto_null_member
+        with trace_decorations() as tracer:
+            # decorators must be looked up after the tracer is installed
+            self.assertIsNot(extendableenum.auto_null_member, original)
+
+            @extendableenum.auto_null_member
+            class Mixin(Enum):
+                pass
+
+            @extendableenum.auto_null_member
+            class Explicit(Enum):
+                NULL = None
+                A = 1
+
+            @extendableenum.copy_enum_members(Explicit)
+            class Copied(Enum):
+                B = 2
+
+            @extendableenum.post_mixin_enum(Copied)
+            class Speak:
+                pass
+
+        # the original decorators are restored
+        self.assertIs(extendableenum.auto_null_member, original)
+        self.assertIs(extendableenum.extendableenum.auto_null_member, original)
+
+        records = {record.qualname.split('.')[-1]: record for record in tracer.records[:3]}
+        # inheritable_enum called by auto_null_member is not recorded separately
+        self.assertEqual(len(tracer.records), 4)
+        self.assertEqual(records['Mixin'].decorator, 'auto_null_member')
+        self.assertTrue(records['Mixin'].rebuilt)
+        self.assertEqual(records['Mixin'].members, 1)
+        # rebuilding releases the original class, which must not be subtracted from the allocations
+        self.assertGreater(records['Mixin'].allocated, 0)
+        self.assertFalse(records['Explicit'].rebuilt)
+        self.assertEqual(records['Copied'].members, 3)
+        self.assertEqual(records['Copied'].module, __name__)
+        # post_mixin_enum records the modified enum
+        self.assertEqual(tracer.records[-1].decorator, 'post_mixin_enum')
+        self.assertEqual(tracer.records[-1].qualname, records['Copied'].qualname)
+        self.assertFalse(tracer.records[-1].rebuilt)
+
+        self.assertListEqual(tracer.report('members', limit=1), [records['Copied']])
+        self.assertEqual(tracer.format_report().splitlines()[-1][:21], '4 decorated classes, ')
+
+    def test_main(self):
+        """Test profiling a script from the command line."""
+        with tempfile.TemporaryDirectory() as directory:
+            script = os.path.join(directory, 'app.py')
+            with open(script, 'w') as script_file:
+                script_file.write(APPLICATION)
+            env = dict(os.environ, PYTHONPATH=_PACKAGE_ROOT)
+            result = subprocess.run([sys.executable, '-m', 'extendableenum.profile', script],
+                                    capture_output=True, text=True, env=env, check=True)
+        self.assertIn('auto_null_member   __main__.SlowEnum', result.stderr)
+
+    def test_main_script_directory(self):
+        """Test that the modules next to a script can be imported by the script."""
+        with tempfile.TemporaryDirectory() as directory:
+            application = os.path.join(directory, 'app')
+            os.mkdir(application)
+            with open(os.path.join(application, 'helper.py'), 'w') as module_file:
+                module_file.write(APPLICATION)
+            with open(os.path.join(application, 'main.py'), 'w') as script_file:
+                script_file.write('import helper\n')
+            env = dict(os.environ, PYTHONPATH=_PACKAGE_ROOT)
+            result = subprocess.run([sys.executable, '-m', 'extendableenum.profile', 'app/main.py'],
+                                    capture_output=True, text=True, env=env, cwd=directory)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('auto_null_member   helper.SlowEnum', result.stderr)
+
+    def test_main_exit_code(self):
+        """Test that the exit code of the application is kept and sys.argv is restored."""
+        with tempfile.TemporaryDirectory() as directory:
+            script = os.path.join(directory, 'app.py')
+            with open(script, 'w') as script_file:
+                script_file.write(APPLICATION + '\nraise SystemExit(3)\n')
+            env = dict(os.environ, PYTHONPATH=_PACKAGE_ROOT)
+            result = subprocess.run([sys.executable, '-m', 'extendableenum.profile', script],
+                                    capture_output=True, text=True, env=env)
+            self.assertEqual(result.returncode, 3)
+            self.assertIn('1 decorated classes', result.stderr)
+
+            argv = list(sys.argv)
+            with self.assertRaises(SystemExit) as context:
+                main([script, 'extra'])
+            self.assertEqual(context.exception.code, 3)
+            self.assertListEqual(sys.argv, argv)
+            self.assertNotIn(directory, sys.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import unittest
+from extendableenum import load_schema, build_enums
+from enum import Enum
+
+
+SCHEMA = [
+    {'name': 'Fruit', 'members': {'APPLE': 1, 'BANANA': 2}},
+    {'name': 'Food', 'copy': ['Fruit', 'Vegetable'], 'members': {'BEEF': 21}, 'auto_null': True},
+    {'name': 'Base', 'members': {'A': 1}, 'inheritable': True},
+    {'name': 'Derived', 'extends': 'Base', 'members': [['B', 2]]},
+]
+
+VEGETABLES = 'enum,name,value\nVegetable,ASPARAGUS,11\nVegetable,BROCCOLI,"""twelve"""\n'
+
+
+class TestSchema(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        with open(os.path.join(self.path, 'enums.json'), 'w') as schema_file:
+            json.dump(SCHEMA, schema_file)
+        with open(os.path.join(self.path, 'vegetables.csv'), 'w') as schema_file:
+            schema_file.write(VEGETABLES)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_build_enums(self):
+        """Test building a registry from a schema directory."""
+        registry = build_enums(self.path)
+        self.assertSetEqual(set(registry), {'Fruit', 'Vegetable', 'Food', 'Base', 'Derived'})
+
+        Fruit, Vegetable, Food = registry['Fruit'], registry['Vegetable'], registry['Food']
+        # CSV values are read as JSON literals where possible
+        self.assertEqual(Vegetable.ASPARAGUS.value, 11)
+        self.assertEqual(Vegetable.BROCCOLI.value, 'twelve')
+        # copied members keep the decorator order, with the null member first
+        self.assertListEqual(Food._member_names_, ['NULL', 'APPLE', 'BANANA', 'ASPARAGUS', 'BROCCOLI', 'BEEF'])
+        self.assertTupleEqual(Food.__copied_from__, (Fruit, Vegetable))
+        self.assertEqual(Food.auto_null_name, 'NULL')
+
+        # the classes belong to the calling module by default
+        self.assertEqual(Food.__module__, __name__)
+
+        Base, Derived = registry['Base'], registry['Derived']
+        self.assertListEqual(Base.__inheritable_members__, ['A'])
+        self.assertIs(Derived.A, Base.A)
+        self.assertListEqual(Derived._member_names_, ['B'])
+
+    def test_parallel(self):
+        """Test building independent enum families in parallel."""
+        registry = build_enums(self.path, max_workers=4)
+        self.assertIs(registry['Food'].__copied_from__[0], registry['Fruit'])
+        self.assertTrue(issubclass(registry['Derived'], registry['Base']))
+
+    def test_known(self):
+        """Test copying existing enums."""
+
+        class Meat(Enum):
+            PORK = 23
+
+        with open(os.path.join(self.path, 'meat.json'), 'w') as schema_file:
+            json.dump({'enums': [{'name': 'MoreFood', 'copy': 'Meat'}]}, schema_file)
+        registry = build_enums(self.path, known={'Meat': Meat})
+        self.assertListEqual(registry['MoreFood']._member_names_, ['PORK'])
+
+    def test_copy_auto_null(self):
+        """Test copying an auto null enum into an auto null enum."""
+        with open(os.path.join(self.path, 'null.json'), 'w') as schema_file:
+            json.dump([{'name': 'NullBase', 'members': {'A': 1}, 'auto_null': True},
+                       {'name': 'NullCopy', 'copy': 'NullBase', 'members': {'B': 2}, 'auto_null': True}],
+                      schema_file)
+        NullCopy = build_enums(self.path)['NullCopy']
+        self.assertListEqual(NullCopy._member_names_, ['NULL', 'A', 'B'])
+        self.assertIs(NullCopy.get(3), NullCopy.NULL)
+
+    def test_cache(self):
+        """Test the binary cache of the parsed schema."""
+        cache_path = os.path.join(self.path, 'schema.cache')
+        entries = load_schema(self.path, cache_path)
+        self.assertTrue(os.path.exists(cache_path))
+
+        # the cached schema is used while the files are unchanged
+        with open(cache_path, 'rb') as cache_file:
+            cached = cache_file.read()
+        self.assertListEqual(load_schema(self.path, cache_path), entries)
+        with open(cache_path, 'rb') as cache_file:
+            self.assertEqual(cache_file.read(), cached)
+
+        # changing a schema file invalidates the cache
+        with open(os.path.join(self.path, 'vegetables.csv'), 'a') as schema_file:
+            schema_file.write('Vegetable,CARROT,13\n')
+        self.assertEqual(len(load_schema(self.path, cache_path)[-1]['members']), 3)
+
+    def test_invalid(self):
+        """Test invalid schemas."""
+        with open(os.path.join(self.path, 'cycle.json'), 'w') as schema_file:
+            json.dump([{'name': 'X', 'copy': ['Y']}, {'name': 'Y', 'copy': ['X']}], schema_file)
+        self.assertRaises(ValueError, build_enums, self.path)
+
+        with open(os.path.join(self.path, 'cycle.json'), 'w') as schema_file:
+            json.dump([{'name': 'X', 'copy': ['Unknown']}], schema_file)
+        self.assertRaises(ValueError, build_enums, self.path)
+
+        with open(os.path.join(self.path, 'cycle.json'), 'w') as schema_file:
+            json.dump([{'name': 'Fruit'}], schema_file)
+        self.assertRaises(ValueError, build_enums, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import sys
+import threading
+import unittest
+from extendableenum import inheritable_enum, all_members
+from enum import Enum
+
+
+class TestThreadSafety(unittest.TestCase):
+    def setUp(self):
+        # switch threads as often as possible to expose partially modified classes.
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_decorate_restore(self):
+        """Test that readers only see fully decorated or fully restored classes."""
+
+        class TestEnum(Enum):
+            A = 1
+            B = 2
+            C = 3
+            D = 4
+
+        members = tuple(TestEnum)
+        names = [member.name for member in members]
+        stop = threading.Event()
+        errors = []
+
+        def read():
+            while not stop.is_set():
+                iterated = [member.name for member in TestEnum]
+                length = len(TestEnum)
+                if iterated not in ([], names) or length not in (0, 4):
+                    errors.append((iterated, length))
+                if all_members(TestEnum) != members:
+                    errors.append(all_members(TestEnum))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        try:
+            for _ in range(2000):
+                inheritable_enum(TestEnum)
+                TestEnum.restore()
+        finally:
+            stop.set()
+            for reader in readers:
+                reader.join()
+
+        self.assertListEqual(errors, [])
+        self.assertListEqual(TestEnum._member_names_, names)
+
+    def test_concurrent_restore(self):
+        """Test that only one of several concurrent restores succeeds."""
+
+        @inheritable_enum
+        class TestEnum(Enum):
+            A = 1
+            B = 2
+
+        restore = TestEnum.restore
+        results = []
+
+        def call_restore():
+            try:
+                restore()
+                results.append(True)
+            except AttributeError:
+                results.append(False)
+
+        threads = [threading.Thread(target=call_restore) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count(True), 1)
+        self.assertListEqual(TestEnum._member_names_, ['A', 'B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from extendableenum import copy_enum_members, UnionDecoder, UnionMatch
+from enum import Enum
+
+
+class Fruit(Enum):
+    APPLE = 1
+    BANANA = 2
+
+
+class Vegetable(Enum):
+    CARROT = 11
+    PEA = [12]
+
+
+@copy_enum_members(Fruit)
+class Produce(Enum):
+    MUSHROOM = 21
+
+
+@copy_enum_members(Produce, Vegetable)
+class Food(Enum):
+    BEEF = 31
+
+
+class TestUnionDecoder(unittest.TestCase):
+    def test_decode(self):
+        """Test decoding values through the __copied_from__ chain."""
+        decoder = UnionDecoder(Food)
+        # values are resolved to the class which originally defined them
+        self.assertTupleEqual(decoder(1), (Fruit, Fruit.APPLE, Food.APPLE))
+        self.assertTupleEqual(decoder(21), (Produce, Produce.MUSHROOM, Food.MUSHROOM))
+        self.assertTupleEqual(decoder(11), (Vegetable, Vegetable.CARROT, Food.CARROT))
+        self.assertTupleEqual(decoder(31), (Food, Food.BEEF, Food.BEEF))
+        self.assertIsInstance(decoder(31), UnionMatch)
+        # unhashable values
+        self.assertTupleEqual(decoder([12]), (Vegetable, Vegetable.PEA, Food.PEA))
+
+        self.assertRaises(ValueError, decoder, 99)
+        self.assertRaises(ValueError, decoder, [99])
+        self.assertIsNone(decoder.get(99))
+        self.assertEqual(decoder.get([99], 'missing'), 'missing')
+        self.assertRaises(TypeError, UnionDecoder, object)
+
+    def test_batch(self):
+        """Test batch and streaming decoding."""
+        decoder = UnionDecoder(Food)
+        values = [2, 21, [12], 31]
+        expected = [decoder(value) for value in values]
+        self.assertListEqual(decoder.decode_many(values), expected)
+        self.assertListEqual(decoder.decode_many(iter(values)), expected)
+        self.assertListEqual(list(decoder.iter_decode(iter(values))), expected)
+        self.assertRaises(ValueError, list, decoder.iter_decode([1, 99]))
+
+        # enums without sources decode to themselves
+        self.assertTupleEqual(UnionDecoder(Fruit)(2), (Fruit, Fruit.BANANA, Fruit.BANANA))
+
+
+if __name__ == '__main__':
+    unittest.main()